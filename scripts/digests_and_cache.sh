@@ -3,6 +3,7 @@
 # Get the parent folder, which is the overlay root
 __script_dir="$(dirname "$(dirname "$(realpath "$0")")")"
 
-find "${__script_dir}" -name "*.ebuild" -exec dirname {} + | sort -u | while read linea; do pushd $linea; for x in *.ebuild; do ebuild $x manifest; done; popd; done
-
-#egencache --update --repo "$(basename "${__script_dir}")"
+# Regenerates stale md5-cache entries with egencache, then every package's
+# Manifest with each distfile hashed once, packages in parallel
+exec python3 "${__script_dir}/scripts/simple-qa-check.py" \
+    --overlay-root "${__script_dir}" --regen --jobs 0 "$@"
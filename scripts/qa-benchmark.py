@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+
+"""
+QA Pipeline Micro-benchmarks
+
+Measures how the pieces of simple-qa-check.py scale with synthetic input,
+without needing pkgcheck, pkgdev or network access.
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Packages per synthetic category, roughly the size of a busy Gentoo category
+PACKAGES_PER_CATEGORY = 200
+EBUILD_TEMPLATE = """# Copyright 2025 Gentoo Authors
+# Distributed under the terms of the GNU General Public License v2
+
+EAPI=8
+
+inherit cargo
+
+DESCRIPTION="Synthetic benchmark package {n}"
+HOMEPAGE="https://example.org/{package}"
+SRC_URI="https://example.org/{package}-1.0.tar.gz"
+
+LICENSE="MIT"
+SLOT="0"
+KEYWORDS="~amd64"
+"""
+
+
+def load_script(name: str) -> ModuleType:
+    """Import a hyphenated script from this directory by its file name."""
+    path = Path(__file__).parent / f"{name}.py"
+    spec = importlib.util.spec_from_file_location(name.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest wall time of repeat calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def synthetic_rules(count: int, rng: random.Random) -> List[Dict[str, Optional[str]]]:
+    """Generate a mix of exact, category, prefix and glob suppression rules."""
+    checks = ["PotentialStable", "VisibleVcsPkg", "IndirectInherits", "*"]
+    rules: List[Dict[str, Optional[str]]] = []
+    for i in range(count):
+        kind = i % 4
+        category = f"cat-{i % 50}"
+        if kind == 0:
+            atom = f"{category}/pkg-{i}"
+        elif kind == 1:
+            atom = category
+        elif kind == 2:
+            atom = f"{category}/pkg-{i % 97}*"
+        else:
+            atom = f"{category}/p?g-{i % 89}"
+        ver = "9999" if rng.random() < 0.1 else None
+        rules.append({"atom": atom, "ver": ver, "check": rng.choice(checks)})
+    return rules
+
+
+def synthetic_issues(
+    count: int, rng: random.Random
+) -> List[Tuple[str, Optional[str], str]]:
+    checks = ["PotentialStable", "VisibleVcsPkg", "IndirectInherits", "BadDesc"]
+    # One in ten is a category-level result, which has no package
+    return [
+        (
+            f"cat-{rng.randrange(100)}"
+            + ("" if rng.random() < 0.1 else f"/pkg-{rng.randrange(2000)}"),
+            rng.choice(["1.0", "9999", None]),
+            rng.choice(checks),
+        )
+        for _ in range(count)
+    ]
+
+
+def linear_matches(
+    rules: List[Dict[str, Optional[str]]], atom: str, ver: Optional[str], check: str
+) -> bool:
+    """The pre-index matcher: try every rule in turn.
+
+    Same semantics as the old should_ignore (a bare category only matches
+    the category's own results), with globs matched through fnmatch.
+    """
+    for rule in rules:
+        pattern, check_pattern = rule["atom"], rule["check"]
+        if not pattern or not check_pattern:
+            continue
+        if not fnmatch.fnmatchcase(atom, pattern):
+            continue
+        if rule["ver"] and rule["ver"] != ver:
+            continue
+        if check_pattern != "*" and not fnmatch.fnmatchcase(check, check_pattern):
+            continue
+        return True
+    return False
+
+
+def bench_rules(args: argparse.Namespace) -> None:
+    qa = load_script("simple-qa-check")
+    rng = random.Random(args.seed)
+    issues = synthetic_issues(args.issues, rng)
+    print(f"Rule matching, {len(issues)} issues (best of {args.repeat})")
+    print(
+        f"{'rules':>8} {'linear s':>10} {'indexed s':>10} "
+        f"{'compile s':>10} {'speedup':>8}"
+    )
+    for count in args.rules:
+        rules = synthetic_rules(count, rng)
+        linear = best_of(
+            lambda: [linear_matches(rules, *issue) for issue in issues], args.repeat
+        )
+        compile_time = best_of(lambda: qa.QARuleSet(rules), args.repeat)
+        ruleset = qa.QARuleSet(rules)
+        if [linear_matches(rules, *issue) for issue in issues] != [
+            ruleset.matches(*issue) for issue in issues
+        ]:
+            sys.exit(f"Linear and indexed matching disagree with {count} rules")
+        indexed = best_of(
+            lambda: [ruleset.matches(*issue) for issue in issues], args.repeat
+        )
+        print(
+            f"{count:>8} {linear:>10.4f} {indexed:>10.4f} {compile_time:>10.4f} "
+            f"{linear / indexed:>7.1f}x"
+        )
+        record(
+            args.record,
+            {
+                "benchmark": "rules",
+                "rules": count,
+                "issues": len(issues),
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "timings": {
+                    "linear": linear,
+                    "indexed": indexed,
+                    "compile": compile_time,
+                },
+            },
+        )
+
+
+def build_overlay(root: Path, packages: int) -> List[Tuple[str, str]]:
+    """Write a synthetic overlay with one ebuild per package.
+
+    Returns the (category, package) pairs that were created.
+    """
+    (root / "metadata").mkdir(parents=True)
+    (root / "metadata" / "layout.conf").write_text("masters = gentoo\n")
+    (root / "profiles").mkdir()
+    (root / "profiles" / "repo_name").write_text("synthetic\n")
+    categories = max(1, packages // PACKAGES_PER_CATEGORY)
+    atoms: List[Tuple[str, str]] = []
+    for n in range(packages):
+        category, package = f"cat-{n % categories}", f"pkg-{n}"
+        pkg_dir = root / category / package
+        pkg_dir.mkdir(parents=True)
+        (pkg_dir / f"{package}-1.0.ebuild").write_text(
+            EBUILD_TEMPLATE.format(n=n, package=package)
+        )
+        (pkg_dir / "metadata.xml").write_text("<pkgmetadata/>\n")
+        (pkg_dir / "Manifest").write_text(f"DIST {package}-1.0.tar.gz 1024\n")
+        atoms.append((category, package))
+    return atoms
+
+
+def write_scan_json(
+    path: Path, atoms: List[Tuple[str, str]], density: float, seed: int
+) -> int:
+    """Write qa-fake-tools.py results, density issues per package on average.
+
+    Returns the number of result lines written.
+    """
+    fake = load_script("qa-fake-tools")
+    packages = [f"{category}/{package}" for category, package in atoms]
+    lines = 0
+    with open(path, "w") as f:
+        for line in fake.generate_scan(packages, density, seed, []):
+            f.write(line + "\n")
+            lines += 1
+    return lines
+
+
+def write_rules(path: Path, count: int, rng: random.Random) -> None:
+    with open(path, "w") as f:
+        for rule in synthetic_rules(count, rng):
+            ver = f":{rule['ver']}" if rule["ver"] else ""
+            f.write(f"{rule['atom']}{ver} {rule['check']}\n")
+
+
+def record(path: Optional[str], entry: Dict[str, Any]) -> None:
+    """Append a benchmark result as a JSON line, tagged with the current commit."""
+    if not path:
+        return
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    entry = {
+        "commit": commit or None,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        **entry,
+    }
+    with open(path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def bench_overlay(args: argparse.Namespace) -> None:
+    qa = load_script("simple-qa-check")
+    rng = random.Random(args.seed)
+    print(
+        f"Synthetic overlay, {args.density} issues/package, {args.rules} rules "
+        f"(best of {args.repeat})"
+    )
+    print(
+        f"{'packages':>8} {'issues':>8} {'inventory s':>12} {'parse s':>9} "
+        f"{'filter s':>9} {'markdown s':>11} {'html s':>8}"
+    )
+    cwd = Path.cwd()
+    for packages in args.packages:
+        with tempfile.TemporaryDirectory(prefix="qa-bench-") as tmp:
+            work = Path(tmp)
+            atoms = build_overlay(work / "overlay", packages)
+            (work / "qa-reports").mkdir()
+            scan_json = work / "qa-reports" / "pkgcheck-scan.json"
+            issues = write_scan_json(scan_json, atoms, args.density, args.seed)
+            write_rules(work / ".qaignore", args.rules, rng)
+            # SimpleQAChecker reads .qaignore and writes qa-reports/ in the cwd
+            os.chdir(work)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    checker = qa.SimpleQAChecker(str(work / "overlay"), "qa-reports")
+                    timings = measure_pipeline(qa, checker, scan_json, args.repeat)
+            finally:
+                os.chdir(cwd)
+        print(
+            f"{packages:>8} {issues:>8} {timings['inventory']:>12.4f} "
+            f"{timings['parse']:>9.4f} {timings['filter']:>9.4f} "
+            f"{timings['markdown']:>11.4f} {timings['html']:>8.4f}"
+        )
+        record(
+            args.record,
+            {
+                "benchmark": "overlay",
+                "packages": packages,
+                "issues": issues,
+                "density": args.density,
+                "rules": args.rules,
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "timings": timings,
+            },
+        )
+
+
+def measure_pipeline(
+    qa: ModuleType, checker: Any, scan_json: Path, repeat: int
+) -> Dict[str, float]:
+    """Time inventory, parsing, rule filtering and each report on its own."""
+    timings: Dict[str, float] = {}
+    timings["inventory"] = best_of(
+        lambda: qa.OverlayInventory(checker.overlay_root), repeat
+    )
+
+    def parse() -> List[Dict[str, Optional[str]]]:
+        with open(scan_json) as f:
+            return [item for line in f for item in checker._parse_pkgcheck_line(line)]
+
+    timings["parse"] = best_of(parse, repeat)
+    items = parse()
+    # Compile the rules up front; the rules benchmark covers their cost
+    checker._get_rules()
+
+    def filter_items() -> Any:
+        results = qa.QAResults("pkgcheck")
+        for item in items:
+            checker._record_result(results, item)
+        return results
+
+    timings["filter"] = best_of(filter_items, repeat)
+    results = filter_items()
+    checker.get_inventory()
+    timings["markdown"] = best_of(
+        lambda: checker.generate_markdown_report(results), repeat
+    )
+    timings["html"] = best_of(lambda: checker.generate_html_report(results), repeat)
+    return timings
+
+
+def bench_pipeline(args: argparse.Namespace) -> None:
+    """Run simple-qa-check.py end to end against the qa-fake-tools.py stand-ins."""
+    scripts = Path(__file__).resolve().parent
+    print(
+        f"End-to-end pipeline, {args.density} results/package, "
+        f"{args.latency}s tool latency, {args.jobs} jobs (best of {args.repeat})"
+    )
+    print(
+        f"{'packages':>8} {'wall s':>8} {'tools s':>8} "
+        f"{'results s':>10} {'reports s':>10}"
+    )
+    for packages in args.packages:
+        with tempfile.TemporaryDirectory(prefix="qa-bench-") as tmp:
+            work = Path(tmp)
+            build_overlay(work / "overlay", packages)
+            (work / "qa-reports").mkdir()
+            subprocess.run(
+                [
+                    sys.executable,
+                    str(scripts / "qa-fake-tools.py"),
+                    "install",
+                    str(work / "tools"),
+                    "--seed",
+                    str(args.seed),
+                    "--latency",
+                    str(args.latency),
+                    "--results-per-package",
+                    str(args.density),
+                ],
+                check=True,
+                capture_output=True,
+            )
+            cmd = [
+                sys.executable,
+                str(scripts / "simple-qa-check.py"),
+                "--overlay-root",
+                str(work / "overlay"),
+                "--tools-dir",
+                str(work / "tools"),
+                "--jobs",
+                str(args.jobs),
+                "--quiet",
+            ]
+            best: Optional[Dict[str, float]] = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                # A failing QA verdict is expected with synthetic errors
+                subprocess.run(cmd, cwd=work, capture_output=True)
+                wall = time.perf_counter() - start
+                with open(work / "qa-reports" / "timings.json") as f:
+                    phases = {
+                        entry["phase"]: entry.get("wall_s", 0.0)
+                        for entry in json.load(f)["phases"]
+                    }
+                timings = {
+                    "wall": wall,
+                    "tools": phases.get("run_qa_tools", 0.0),
+                    "results": phases.get("get_qa_results", 0.0),
+                    "reports": sum(
+                        value
+                        for name, value in phases.items()
+                        if name.startswith("generate_")
+                    ),
+                }
+                if best is None or wall < best["wall"]:
+                    best = timings
+        assert best is not None
+        print(
+            f"{packages:>8} {best['wall']:>8.3f} {best['tools']:>8.3f} "
+            f"{best['results']:>10.3f} {best['reports']:>10.3f}"
+        )
+        record(
+            args.record,
+            {
+                "benchmark": "pipeline",
+                "packages": packages,
+                "density": args.density,
+                "latency": args.latency,
+                "jobs": args.jobs,
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "timings": best,
+            },
+        )
+
+
+def int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main() -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the COSMIC overlay QA pipeline"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for inputs")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (best is kept)"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="Append results with the current commit SHA to FILE as JSON lines",
+    )
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    rules_parser = subparsers.add_parser(
+        "rules", help="Compare linear and indexed .qaignore rule matching"
+    )
+    rules_parser.add_argument(
+        "--rules",
+        type=int_list,
+        default=[10, 100, 1000, 5000],
+        help="Comma-separated rule counts",
+    )
+    rules_parser.add_argument(
+        "--issues", type=int, default=20000, help="Number of issues to match"
+    )
+    rules_parser.set_defaults(func=bench_rules)
+
+    overlay_parser = subparsers.add_parser(
+        "overlay",
+        help="Time inventory, parsing, filtering and reports on synthetic overlays",
+    )
+    overlay_parser.add_argument(
+        "--packages",
+        type=int_list,
+        default=[10, 100, 1000, 10000],
+        help="Comma-separated overlay sizes, in packages (up to 100000)",
+    )
+    overlay_parser.add_argument(
+        "--density",
+        type=float,
+        default=2.0,
+        help="Average pkgcheck results per package",
+    )
+    overlay_parser.add_argument(
+        "--rules", type=int, default=100, help="Number of .qaignore rules"
+    )
+    overlay_parser.set_defaults(func=bench_overlay)
+
+    pipeline_parser = subparsers.add_parser(
+        "pipeline",
+        help="Run simple-qa-check.py end to end with fake pkgcheck/pkgdev",
+    )
+    pipeline_parser.add_argument(
+        "--packages",
+        type=int_list,
+        default=[10, 100, 1000],
+        help="Comma-separated overlay sizes, in packages",
+    )
+    pipeline_parser.add_argument(
+        "--density",
+        type=float,
+        default=2.0,
+        help="Average fake pkgcheck results per package",
+    )
+    pipeline_parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Startup latency of each fake tool invocation",
+    )
+    pipeline_parser.add_argument(
+        "--jobs", "-j", type=int, default=1, help="simple-qa-check.py --jobs value"
+    )
+    pipeline_parser.set_defaults(func=bench_pipeline)
+
+    args = parser.parse_args()
+    try:
+        args.func(args)
+    except KeyboardInterrupt:
+        print("\n⚠️  Benchmark interrupted by user")
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
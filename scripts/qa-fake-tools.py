@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+"""
+Fake pkgcheck/pkgdev Stand-ins
+
+Installs pkgcheck and pkgdev stand-ins into a directory. They replay recorded
+output or generate synthetic results with configurable volume, latency and
+exit codes, so simple-qa-check.py can be run and benchmarked end to end
+(via --tools-dir) on a host without Gentoo tooling or network access.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+CONFIG_NAME = "fake-tools.json"
+TOOLS = ("pkgcheck", "pkgdev")
+FAKE_VERSION = "0.0.0-fake"
+CHECKS = [
+    "PotentialStable",
+    "VisibleVcsPkg",
+    "IndirectInherits",
+    "BadDescription",
+    "MissingLicense",
+    "RedundantVersion",
+]
+# Relative weights of the pkgcheck levels in generated results
+LEVEL_WEIGHTS = {"error": 1, "warning": 4, "info": 2, "style": 3}
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "seed": 0,
+    "latency": 0.0,
+    "line_delay": 0.0,
+    "results_per_package": 2.0,
+    "replay_scan": None,
+    "pkgcheck_exit": 0,
+    "manifest_lines": 0,
+    "replay_manifest": None,
+    "pkgdev_exit": 0,
+}
+
+
+def load_checker() -> ModuleType:
+    """Import simple-qa-check.py from next to this script."""
+    path = Path(__file__).resolve().parent / "simple-qa-check.py"
+    spec = importlib.util.spec_from_file_location("simple_qa_check", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_config() -> Dict[str, Any]:
+    """Read the config written by install next to the invoked stand-in."""
+    config = dict(DEFAULT_CONFIG)
+    path = Path(os.path.abspath(sys.argv[0])).parent / CONFIG_NAME
+    try:
+        with open(path) as f:
+            config.update(json.load(f))
+    except (IOError, ValueError):
+        pass
+    return config
+
+
+def emit(lines: Iterator[str], line_delay: float) -> None:
+    for line in lines:
+        sys.stdout.write(line if line.endswith("\n") else line + "\n")
+        if line_delay:
+            sys.stdout.flush()
+            time.sleep(line_delay)
+    sys.stdout.flush()
+
+
+def scan_packages(targets: List[str]) -> Optional[Set[str]]:
+    """Map scan targets to "category/package" names; None means the whole repo."""
+    packages: Set[str] = set()
+    for target in targets or ["."]:
+        path = Path(target).resolve()
+        if (path / "profiles").is_dir():
+            return None
+        if (path.parent / "profiles").is_dir():
+            # A category target scans every package below it
+            packages.update(
+                f"{path.name}/{package.name}"
+                for package in path.iterdir()
+                if package.is_dir()
+            )
+        else:
+            packages.add(f"{path.parent.name}/{path.name}")
+    return packages
+
+
+def overlay_packages(root: Path, packages: Optional[Set[str]]) -> List[str]:
+    """List the "category/package" directories holding ebuilds, sorted."""
+    if packages is not None:
+        return sorted(packages)
+    # Skip the same top-level directories the checker does
+    non_category_dirs = load_checker().NON_CATEGORY_DIRS
+    found: List[str] = []
+    for category in sorted(os.scandir(root), key=lambda entry: entry.name):
+        if (
+            not category.is_dir()
+            or category.name[0] == "."
+            or category.name in non_category_dirs
+        ):
+            continue
+        package_dirs = sorted(os.scandir(category.path), key=lambda entry: entry.name)
+        for package in package_dirs:
+            if package.is_dir() and any(
+                name.endswith(".ebuild") for name in os.listdir(package.path)
+            ):
+                found.append(f"{category.name}/{package.name}")
+    return found
+
+
+def replay_scan(
+    path: str, packages: Optional[Set[str]], package_scope: bool
+) -> Iterator[str]:
+    """Yield recorded JsonReporter lines that belong to the scanned packages.
+
+    Without package_scope only repository and category results are replayed.
+    """
+    with open(path) as f:
+        for line in f:
+            if packages is None and package_scope:
+                yield line
+                continue
+            try:
+                entry = json.loads(line)
+                category = next(iter(entry))
+                package = next(iter(entry[category]))
+            except (ValueError, StopIteration, TypeError, AttributeError):
+                continue
+            if packages is None:
+                if category.startswith("_") or package.startswith("_"):
+                    yield line
+            elif f"{category}/{package}" in packages:
+                yield line
+
+
+def generate_scan(
+    packages: List[str], per_package: float, seed: int, arches: List[str]
+) -> Iterator[str]:
+    """Yield synthetic JsonReporter lines for each package.
+
+    Every package gets its own RNG seeded from its name, so sharded and
+    whole-repo scans of the same overlay produce identical results. Scans
+    restricted with --arches add an UnstableOnly result for about half of
+    the packages, the same for every scan of that arch.
+    """
+    levels = list(LEVEL_WEIGHTS)
+    weights = list(LEVEL_WEIGHTS.values())
+    for atom in packages:
+        digest = hashlib.sha256(f"{seed}:{atom}".encode()).digest()
+        rng = random.Random(int.from_bytes(digest[:8], "big"))
+        category, package = atom.split("/", 1)
+        count = int(per_package) + (rng.random() < per_package % 1)
+        for n in range(count):
+            level = rng.choices(levels, weights)[0]
+            check = rng.choice(CHECKS)
+            result = {f"_{level}": {check: f"synthetic {check} result {n}"}}
+            if rng.random() < 0.7:
+                result = {"9999": result}
+            yield json.dumps({category: {package: result}})
+        for arch in arches:
+            if hashlib.sha256(f"{seed}:{atom}:{arch}".encode()).digest()[0] < 128:
+                result = {"_warning": {"UnstableOnly": f"for arches: [ {arch} ]"}}
+                yield json.dumps({category: {package: result}})
+
+
+def generate_repo_scan(packages: List[str], seed: int) -> Iterator[str]:
+    """Yield synthetic repository and category results of a whole-repo scan."""
+    for category in sorted({atom.split("/", 1)[0] for atom in packages}):
+        if hashlib.sha256(f"{seed}:{category}".encode()).digest()[0] < 128:
+            result = {"_warning": {"EmptyCategoryDir": "synthetic category result"}}
+            yield json.dumps({category: result})
+    yield json.dumps({"_info": {"RepoCheck": "synthetic repository result"}})
+
+
+def fake_pkgcheck(args: List[str], config: Dict[str, Any]) -> int:
+    if "--version" in args:
+        print(f"pkgcheck {FAKE_VERSION}")
+        return 0
+    if not args or args[0] != "scan":
+        print(f"fake pkgcheck: unsupported arguments: {args}", file=sys.stderr)
+        return 2
+    targets: List[str] = []
+    arches: List[str] = []
+    scopes: List[str] = []
+    rest = iter(args[1:])
+    for arg in rest:
+        if arg in ("--arches", "-a"):
+            arches += next(rest, "").split(",")
+        elif arg in ("--scopes", "-s") or arg.startswith("--scopes="):
+            value = arg.split("=", 1)[1] if "=" in arg else next(rest, "")
+            scopes += value.split(",")
+        elif arg in ("--config", "--reporter", "-r", "--jobs", "-j", "--profiles"):
+            next(rest, None)
+        elif not arg.startswith("-"):
+            targets.append(arg)
+    time.sleep(config["latency"])
+    packages = scan_packages(targets)
+    package_scope = "-package" not in scopes
+    if config["replay_scan"]:
+        lines = replay_scan(config["replay_scan"], packages, package_scope)
+    else:
+        atoms = overlay_packages(Path.cwd(), packages)
+        lines = iter(())
+        if package_scope:
+            lines = generate_scan(
+                atoms,
+                config["results_per_package"],
+                config["seed"],
+                [arch for arch in arches if arch],
+            )
+        if packages is None:
+            lines = itertools.chain(lines, generate_repo_scan(atoms, config["seed"]))
+    emit(lines, config["line_delay"])
+    return config["pkgcheck_exit"]
+
+
+def fake_pkgdev(args: List[str], config: Dict[str, Any]) -> int:
+    if "--version" in args:
+        print(f"pkgdev {FAKE_VERSION}")
+        return 0
+    if not args or args[0] != "manifest":
+        print(f"fake pkgdev: unsupported arguments: {args}", file=sys.stderr)
+        return 2
+    time.sleep(config["latency"])
+    if config["replay_manifest"]:
+        with open(config["replay_manifest"]) as f:
+            emit(iter(f), config["line_delay"])
+    else:
+        emit(
+            (f"* Manifest entry {n} verified" for n in range(config["manifest_lines"])),
+            config["line_delay"],
+        )
+    return config["pkgdev_exit"]
+
+
+def install(args: argparse.Namespace) -> None:
+    """Link the stand-ins into a directory and write their config."""
+    tools_dir = Path(args.dir).resolve()
+    tools_dir.mkdir(parents=True, exist_ok=True)
+    script = Path(__file__).resolve()
+    for tool in TOOLS:
+        link = tools_dir / tool
+        if link.is_symlink() or link.exists():
+            link.unlink()
+        link.symlink_to(script)
+    config = {
+        "seed": args.seed,
+        "latency": args.latency,
+        "line_delay": args.line_delay,
+        "results_per_package": args.results_per_package,
+        "replay_scan": (
+            str(Path(args.replay_scan).resolve()) if args.replay_scan else None
+        ),
+        "pkgcheck_exit": args.pkgcheck_exit,
+        "manifest_lines": args.manifest_lines,
+        "replay_manifest": (
+            str(Path(args.replay_manifest).resolve()) if args.replay_manifest else None
+        ),
+        "pkgdev_exit": args.pkgdev_exit,
+    }
+    with open(tools_dir / CONFIG_NAME, "w") as f:
+        json.dump(config, f, indent=2)
+        f.write("\n")
+    print(f"✅ Fake pkgcheck and pkgdev installed in {tools_dir}")
+    print(f"   Use: simple-qa-check.py --tools-dir {tools_dir}")
+
+
+def main() -> None:
+    """Main function."""
+    tool = Path(sys.argv[0]).name
+    if tool in TOOLS:
+        config = load_config()
+        handler = fake_pkgcheck if tool == "pkgcheck" else fake_pkgdev
+        sys.exit(handler(sys.argv[1:], config))
+
+    parser = argparse.ArgumentParser(
+        description="Install fake pkgcheck/pkgdev stand-ins for offline QA runs"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    install_parser = subparsers.add_parser(
+        "install", help="Create pkgcheck and pkgdev stand-ins in a directory"
+    )
+    install_parser.add_argument("dir", help="Directory to install the stand-ins into")
+    install_parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for generated results"
+    )
+    install_parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Delay before any output, per invocation",
+    )
+    install_parser.add_argument(
+        "--line-delay",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="Delay after every output line",
+    )
+    install_parser.add_argument(
+        "--results-per-package",
+        type=float,
+        default=2.0,
+        help="Average generated pkgcheck results per scanned package",
+    )
+    install_parser.add_argument(
+        "--replay-scan",
+        metavar="FILE",
+        help="Replay this recorded pkgcheck-scan.json instead of generating results",
+    )
+    install_parser.add_argument(
+        "--pkgcheck-exit", type=int, default=0, help="pkgcheck scan exit code"
+    )
+    install_parser.add_argument(
+        "--manifest-lines",
+        type=int,
+        default=0,
+        help="Lines of generated pkgdev manifest output",
+    )
+    install_parser.add_argument(
+        "--replay-manifest",
+        metavar="FILE",
+        help="Replay this recorded manifest-check.txt as pkgdev output",
+    )
+    install_parser.add_argument(
+        "--pkgdev-exit", type=int, default=0, help="pkgdev manifest exit code"
+    )
+    install_parser.set_defaults(func=install)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
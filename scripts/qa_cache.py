@@ -0,0 +1,60 @@
+"""
+Result cache for simple-qa-check.py
+
+pkgcheck result lines are stored per package fingerprint, so unchanged
+packages are replayed instead of scanned.
+"""
+
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class QACache:
+    """Content-addressed store of pkgcheck result lines, evicted LRU by mtime."""
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root: Path = root
+        self.max_bytes: int = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.jsonl"
+
+    def get(self, key: str) -> Optional[List[str]]:
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                lines = f.readlines()
+            os.utime(path)
+        except (IOError, OSError):
+            return None
+        return lines
+
+    def put(self, key: str, lines: List[str]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, path)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries: List[Tuple[float, int, Path]] = []
+        total = 0
+        for path in self.root.glob("*/*.jsonl"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink()
+            total -= size
+            removed += 1
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+        return removed
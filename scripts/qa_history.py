@@ -0,0 +1,133 @@
+"""
+QA run history for simple-qa-check.py
+
+Every run's issues are stored in an SQLite database keyed by commit SHA, so a
+run can be compared against the stored run of a baseline commit. Runs keep
+their scan scope and whether the tree had uncommitted changes, and only
+clean runs of the whole overlay serve as baselines.
+"""
+
+import hashlib
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# (category, package, version, level, check, message, tolerated)
+IssueRow = Tuple[str, str, str, str, str, str, int]
+
+
+class QAHistory:
+    """SQLite store of QA runs and their issues, keyed by commit SHA."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            commit_sha TEXT NOT NULL,
+            created REAL NOT NULL,
+            scope TEXT NOT NULL,
+            qa_tool TEXT NOT NULL,
+            dirty INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS runs_commit ON runs (commit_sha, id);
+        CREATE TABLE IF NOT EXISTS issues (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            ident TEXT NOT NULL,
+            category TEXT NOT NULL,
+            package TEXT NOT NULL,
+            version TEXT NOT NULL,
+            level TEXT NOT NULL,
+            check_name TEXT NOT NULL,
+            message TEXT NOT NULL,
+            tolerated INTEGER NOT NULL,
+            PRIMARY KEY (run_id, ident)
+        ) WITHOUT ROWID;
+    """
+    COLUMNS = "category, package, version, level, check_name, message, tolerated"
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path))
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.executescript(self.SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(runs)")}
+        if "dirty" not in columns:
+            # Databases written before runs were flagged
+            conn.execute("ALTER TABLE runs ADD COLUMN dirty INTEGER NOT NULL DEFAULT 0")
+        return conn
+
+    @staticmethod
+    def _ident(issue: Any) -> str:
+        # (category, package, version, check, message), so the (run_id, ident)
+        # primary key turns baseline diffs into index lookups
+        key = "\0".join(
+            (issue.category, issue.package, issue.version, issue.check)
+            + (" ".join(issue.message.split()),)
+        )
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def record_run(self, commit_sha: str, scope: str, dirty: bool, results: Any) -> int:
+        """Store a run and the issues of its QAResults; returns the new run id."""
+        with closing(self._connect()) as conn, conn:
+            run_id = conn.execute(
+                "INSERT INTO runs (commit_sha, created, scope, qa_tool, dirty)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (commit_sha, time.time(), scope, results.qa_tool, int(dirty)),
+            ).lastrowid
+            conn.executemany(
+                f"INSERT OR IGNORE INTO issues (run_id, ident, {self.COLUMNS})"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        self._ident(issue),
+                        issue.category,
+                        issue.package,
+                        issue.version,
+                        issue.level,
+                        issue.check,
+                        issue.message,
+                        int(issue.tolerated),
+                    )
+                    for issue in results.issues
+                ),
+            )
+        return run_id
+
+    def find_run(
+        self, commit_sha: str, scope: str, before: Optional[int] = None
+    ) -> Optional[int]:
+        """Return the latest clean run of a commit (SHA or prefix) with scope."""
+        prefix = commit_sha.lower()
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT id FROM runs WHERE commit_sha >= ? AND commit_sha < ?"
+                " AND scope = ? AND NOT dirty AND id < ? ORDER BY id DESC LIMIT 1",
+                (
+                    prefix,
+                    prefix + "g",
+                    scope,
+                    before if before is not None else sys.maxsize,
+                ),
+            ).fetchone()
+        return row[0] if row else None
+
+    def diff(
+        self, baseline_run: int, run: int
+    ) -> Tuple[List[IssueRow], List[IssueRow]]:
+        """Return (new, fixed) issue rows of run relative to baseline_run."""
+        query = (
+            f"SELECT {self.COLUMNS} FROM issues AS cur WHERE cur.run_id = ?"
+            " AND NOT EXISTS (SELECT 1 FROM issues AS old"
+            " WHERE old.run_id = ? AND old.ident = cur.ident)"
+            " ORDER BY category, package, version, check_name"
+        )
+        with closing(self._connect()) as conn:
+            new = conn.execute(query, (run, baseline_run)).fetchall()
+            fixed = conn.execute(query, (baseline_run, run)).fetchall()
+        return new, fixed
@@ -0,0 +1,94 @@
+"""
+In-process pkgcheck backend for simple-qa-check.py
+
+Runs scans through pkgcheck's Python API instead of spawning processes.
+Retargeting parsed options relies on private pkgcheck helpers, so PkgcheckAPI
+raises ImportError when pkgcheck is not installed or its helpers do not have
+the expected signatures, and the caller runs pkgcheck processes instead.
+"""
+
+import copy
+import inspect
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class PkgcheckAPI:
+    """In-process pkgcheck scans that reuse the loaded config and repository."""
+
+    # pkgcheck scan options we pass that take a separate value
+    VALUE_OPTIONS = {"--config", "--reporter", "--jobs", "--arches", "--profiles"}
+
+    def __init__(self) -> None:
+        # Optional dependency: ImportError makes the caller use the CLI
+        import pkgcheck
+
+        self._pkgcheck = pkgcheck
+        self.version: str = f"pkgcheck {getattr(pkgcheck, '__version__', '')}"
+        # Private pkgcheck helpers to retarget parsed options; without them
+        # every scan would parse its arguments (and load the repo) again
+        try:
+            from pkgcheck.pipeline import Pipeline
+            from pkgcheck.scripts.pkgcheck_scan import _path_restrict
+        except (ImportError, AttributeError) as e:
+            raise ImportError(f"{self.version} lacks the private scan helpers: {e}")
+        for helper, params in (
+            (Pipeline, ["options"]),
+            (_path_restrict, ["path", "namespace"]),
+        ):
+            if not self._accepts(helper, params):
+                raise ImportError(
+                    f"{self.version}: unsupported {helper.__name__} signature"
+                )
+        self._pipeline: Any = Pipeline
+        self._path_restrict: Any = _path_restrict
+        self._options: Dict[Tuple[str, ...], Any] = {}
+
+    @staticmethod
+    def _accepts(helper: Any, params: List[str]) -> bool:
+        """Whether helper takes exactly the positional parameters params."""
+        try:
+            signature = inspect.signature(helper)
+        except (TypeError, ValueError):
+            return False
+        return list(signature.parameters) == params
+
+    def _split_targets(self, args: List[str]) -> Tuple[List[str], List[str]]:
+        options: List[str] = []
+        targets: List[str] = []
+        values = iter(args)
+        for arg in values:
+            if arg in self.VALUE_OPTIONS:
+                options += [arg, next(values, "")]
+            elif arg.startswith("-"):
+                options.append(arg)
+            else:
+                targets.append(arg)
+        return options, targets
+
+    def _pipeline_for(self, args: List[str], root: Path) -> Iterator[Any]:
+        # Scans with the options of an earlier scan only swap the targets
+        options, targets = self._split_targets(args)
+        targets = [str(root / target) for target in targets]
+        cached = self._options.get(tuple(options))
+        if cached is not None:
+            namespace = copy.copy(cached)
+            namespace.restrictions = [
+                self._path_restrict(target, namespace) for target in targets
+            ]
+            return self._pipeline(namespace)
+        pipeline = self._pkgcheck.scan(options + targets)
+        self._options[tuple(options)] = pipeline.options
+        return pipeline
+
+    def scan(self, args: List[str], root: Path) -> Iterator[Dict[str, Optional[str]]]:
+        """Yield result records for args, with relative targets under root."""
+        for result in self._pipeline_for(args, root):
+            yield {
+                "category": getattr(result, "category", None),
+                "package": getattr(result, "package", None),
+                "version": getattr(result, "version", None),
+                "level": result.level,
+                "check": type(result).__name__,
+                "message": result.desc,
+            }
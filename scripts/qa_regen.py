@@ -0,0 +1,280 @@
+"""
+Manifest and metadata cache regeneration for simple-qa-check.py --regen
+
+egencache only updates stale md5-cache entries; thin Manifests are written
+natively where possible and by `ebuild manifest` otherwise.
+"""
+
+import asyncio
+import hashlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Manifest hash names verified for DIST entries, mapped to hashlib names
+MANIFEST_HASHES: Dict[str, str] = {
+    "BLAKE2B": "blake2b",
+    "SHA512": "sha512",
+    "SHA256": "sha256",
+}
+
+
+class ManifestRegenerator:
+    """Regenerates the metadata cache and Manifests of a SimpleQAChecker's overlay."""
+
+    def __init__(self, checker: Any) -> None:
+        self.overlay_root: Path = checker.overlay_root
+        self.distdir: Optional[Path] = checker.distdir
+        self.jobs: int = checker.jobs
+        self.get_inventory = checker.get_inventory
+        # Distfiles are hashed through the checker's digest cache
+        self._distfile_digests = checker._distfile_digests
+        self._which = checker._which
+        self._log = checker._log
+        self._error = checker._error
+        self._success = checker._success
+
+    def _layout_conf(self) -> Dict[str, str]:
+        """Return the key = value settings of metadata/layout.conf."""
+        settings: Dict[str, str] = {}
+        try:
+            with open(self.overlay_root / "metadata" / "layout.conf") as f:
+                for line in f:
+                    key, sep, value = line.partition("=")
+                    if sep and not key.lstrip().startswith("#"):
+                        settings[key.strip()] = value.strip()
+        except IOError:
+            pass
+        return settings
+
+    def _default_distdir(self) -> Path:
+        """Return --distdir, else portage's DISTDIR, else the Gentoo default."""
+        if self.distdir is not None:
+            return self.distdir
+        if self._which("portageq"):
+            result = subprocess.run(
+                ["portageq", "distdir"], capture_output=True, text=True
+            )
+            if result.returncode == 0 and result.stdout.strip():
+                return Path(result.stdout.strip())
+        return Path(os.environ.get("DISTDIR", "/var/cache/distfiles"))
+
+    def _md5_cache_entry(self, path: Path) -> Dict[str, str]:
+        """Parse a metadata/md5-cache entry into its KEY=value pairs."""
+        entry: Dict[str, str] = {}
+        try:
+            with open(path) as f:
+                for line in f:
+                    key, sep, value = line.rstrip("\n").partition("=")
+                    if sep:
+                        entry[key] = value
+        except IOError:
+            pass
+        return entry
+
+    def stale_cache_targets(self) -> List[str]:
+        """Return packages whose md5-cache entries are missing or outdated."""
+        # Only overlay eclasses are compared, not those of master repositories
+        cache_dir = self.overlay_root / "metadata" / "md5-cache"
+        eclass_md5: Dict[str, str] = {
+            path.stem: hashlib.md5(path.read_bytes()).hexdigest()
+            for path in self.get_inventory().eclasses
+        }
+        stale: Set[str] = set()
+        for ebuild in self.get_inventory().ebuilds:
+            category, package = ebuild.parent.parent.name, ebuild.parent.name
+            entry_path = cache_dir / category / ebuild.stem
+            entry = self._md5_cache_entry(entry_path)
+            if entry.get("_md5_") != hashlib.md5(ebuild.read_bytes()).hexdigest():
+                stale.add(f"{category}/{package}")
+                continue
+            inherited = entry.get("_eclasses_", "").split("\t")
+            for name, md5 in zip(inherited[::2], inherited[1::2]):
+                if name in eclass_md5 and eclass_md5[name] != md5:
+                    stale.add(f"{category}/{package}")
+                    break
+        return sorted(stale)
+
+    def prune_cache_entries(self) -> int:
+        """Delete md5-cache entries of removed ebuilds; returns how many."""
+        cache_dir = self.overlay_root / "metadata" / "md5-cache"
+        if not cache_dir.is_dir():
+            return 0
+        current = {
+            cache_dir / ebuild.parent.parent.name / ebuild.stem
+            for ebuild in self.get_inventory().ebuilds
+        }
+        pruned = 0
+        for entry_path in cache_dir.glob("*/*"):
+            if entry_path not in current:
+                entry_path.unlink()
+                pruned += 1
+        return pruned
+
+    def _src_uri_distfiles(self, src_uri: str) -> Set[str]:
+        """Return the distfile names of a SRC_URI, across all USE conditionals."""
+        names: Set[str] = set()
+        tokens = src_uri.split()
+        for index, token in enumerate(tokens):
+            if token in ("(", ")", "->") or token.endswith("?"):
+                continue
+            if index > 0 and tokens[index - 1] == "->":
+                continue
+            if index + 2 < len(tokens) and tokens[index + 1] == "->":
+                names.add(tokens[index + 2])
+            else:
+                names.add(token.rsplit("/", 1)[-1])
+        return names
+
+    def _package_distfiles(self, target: str) -> Optional[Set[str]]:
+        """Return a package's distfiles from md5-cache, None without an entry."""
+        category = target.split("/")[0]
+        cache_dir = self.overlay_root / "metadata" / "md5-cache" / category
+        names: Set[str] = set()
+        for ebuild in sorted((self.overlay_root / target).glob("*.ebuild")):
+            entry = self._md5_cache_entry(cache_dir / ebuild.stem)
+            if "_md5_" not in entry:
+                return None
+            names |= self._src_uri_distfiles(entry.get("SRC_URI", ""))
+        return names
+
+    async def _run_regen_tool(
+        self, cmd: List[str], semaphore: asyncio.Semaphore
+    ) -> bool:
+        """Run one egencache/ebuild command in the overlay, logging failures."""
+        async with semaphore:
+            self._log(f"Running: {' '.join(cmd)}")
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.overlay_root,
+            )
+            output, _ = await process.communicate()
+        if process.returncode != 0:
+            self._error(f"{cmd[0]} failed with exit code {process.returncode}")
+            print(output.decode(errors="replace"), file=sys.stderr)
+            return False
+        return True
+
+    async def run(self) -> bool:
+        """Run egencache on stale packages, then write or delegate each Manifest."""
+        self._log("=== Regenerating Manifests and metadata cache ===")
+        semaphore = asyncio.Semaphore(self.jobs)
+        success = True
+        targets = self.get_inventory().package_targets
+        stale = self.stale_cache_targets()
+        pruned = self.prune_cache_entries()
+        self._log(
+            f"Metadata cache: {len(stale)} of {len(targets)} packages stale, "
+            f"{pruned} entries of removed ebuilds deleted"
+        )
+        # Packages whose SRC_URI cannot be read from the cache yet
+        uncached: Set[str] = set(stale)
+        if stale and self._which("egencache"):
+            repo_name_file = self.overlay_root / "profiles" / "repo_name"
+            repo_name = repo_name_file.read_text().strip()
+            success = await self._run_regen_tool(
+                [
+                    "egencache",
+                    "--update",
+                    "--repo",
+                    repo_name,
+                    "--jobs",
+                    str(self.jobs),
+                ]
+                + stale,
+                semaphore,
+            )
+            if success:
+                uncached.clear()
+        elif stale:
+            self._log("egencache not available - metadata cache left stale")
+
+        # Thin Manifests are written natively from the cached SRC_URIs, so
+        # shared distfiles are hashed once; the rest is left to ebuild
+        layout = self._layout_conf()
+        hash_names = layout.get("manifest-hashes", "BLAKE2B SHA512").split()
+        native = layout.get("thin-manifests", "false").lower() == "true" and all(
+            name in MANIFEST_HASHES for name in hash_names
+        )
+        distdir = self._default_distdir()
+        planned: Dict[str, Set[str]] = {}
+        fallback: List[str] = []
+        for target in targets:
+            names = (
+                self._package_distfiles(target)
+                if native and target not in uncached
+                else None
+            )
+            if names is None or any(not (distdir / name).is_file() for name in names):
+                fallback.append(target)
+            else:
+                planned[target] = names
+
+        algorithms = [MANIFEST_HASHES[name] for name in hash_names]
+        digests = self._distfile_digests(
+            {
+                str(distdir / name): algorithms
+                for names in planned.values()
+                for name in names
+            }
+        )
+        updated = 0
+        native_count = len(planned)
+        for target, names in planned.items():
+            lines = []
+            for name in sorted(names):
+                path = distdir / name
+                file_digests = digests.get(str(path))
+                if file_digests is None:
+                    # Hashing failed and was reported, let ebuild retry
+                    self._error(f"No digests for {path}, {target} left to ebuild")
+                    fallback.append(target)
+                    native_count -= 1
+                    break
+                hashes = " ".join(
+                    f"{hash_name} {file_digests[MANIFEST_HASHES[hash_name]]}"
+                    for hash_name in hash_names
+                )
+                lines.append(f"DIST {name} {path.stat().st_size} {hashes}\n")
+            if target in fallback:
+                continue
+            manifest = self.overlay_root / target / "Manifest"
+            content = "".join(lines)
+            old = manifest.read_text() if manifest.is_file() else ""
+            if content == old:
+                continue
+            if content:
+                manifest.write_text(content)
+            else:
+                manifest.unlink()
+            updated += 1
+        self._log(
+            f"Manifests: {updated} of {native_count} updated natively, "
+            f"{len(fallback)} left to ebuild"
+        )
+
+        if fallback and not self._which("ebuild"):
+            self._error(f"ebuild not available for: {', '.join(fallback)}")
+            return False
+        # One ebuild per package is enough, its manifest phase covers them all
+        outcomes = await asyncio.gather(
+            *(
+                self._run_regen_tool(
+                    [
+                        "ebuild",
+                        str(sorted((self.overlay_root / target).glob("*.ebuild"))[0]),
+                        "manifest",
+                    ],
+                    semaphore,
+                )
+                for target in fallback
+            )
+        )
+        success = success and all(outcomes)
+        if success:
+            self._success("Manifests and metadata cache regenerated")
+        return success
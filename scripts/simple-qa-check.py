@@ -7,18 +7,692 @@ This script provides comprehensive QA checks using modern Gentoo tools
 and generates reports in the qa-reports directory.
 """
 
+import hashlib
 import json
 import os
+import resource
 import shutil
 import re
+import sqlite3
 import sys
 import argparse
+import asyncio
+import configparser
+import ctypes
+import mmap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set
+from typing import Awaitable, Iterator, TypeVar
 import subprocess
 from datetime import datetime
 import io
 import fnmatch
+import select
+import struct
+import tempfile
+import threading
+import time
+import traceback
+
+from qa_cache import QACache
+from qa_history import QAHistory
+from qa_pkgcheck_api import PkgcheckAPI
+from qa_regen import MANIFEST_HASHES, ManifestRegenerator
+
+# Top-level directories that never hold packages
+NON_CATEGORY_DIRS: List[str] = ["metadata", "profiles", "scripts", "files", "eclass"]
+# Changes under these directories can affect every package in the overlay
+REPO_WIDE_DIRS: List[str] = ["metadata", "profiles"]
+INHERIT_RE = re.compile(r"^\s*inherit\s+([^#]+)")
+# Seconds between progress lines while pkgcheck results stream in
+PROGRESS_INTERVAL: float = 5.0
+# Longest pkgcheck output line accepted from the pipe, in bytes
+STREAM_LIMIT: int = 16 * 1024 * 1024
+# pkgcheck exit codes of a completed scan; 1 means results matched "exit ="
+PKGCHECK_OK_EXIT_CODES: Tuple[int, ...] = (0, 1)
+# Disables the checks per-package shards run, for the repo-scope pass
+REPO_SCOPE_ARG: str = "--scopes=-version,-package"
+# Exit code key of the repo-scope pass
+REPO_SCOPE: str = "repo-scope"
+# Generated below metadata/, not an input to any pkgcheck result
+METADATA_CACHE_DIRS: Tuple[str, ...] = ("md5-cache", "cache")
+# pkgcheck result levels, in report order
+LEVELS: Tuple[str, ...] = ("error", "warning", "info", "style")
+# Issue rows rendered per batch on HTML category pages
+REPORT_PAGE_SIZE: int = 1000
+# Write buffer for report files, in bytes
+REPORT_BUFFER: int = 64 * 1024
+REPORT_STYLE: str = """\
+        body { font-family: 'Segoe UI', Arial, sans-serif; margin: 2em; background: #f8f9fa; }
+        h1, h2, h3 { color: #2d3748; }
+        pre { background: #eee; padding: 1em; border-radius: 6px; }
+        code { background: #e2e8f0; padding: 2px 4px; border-radius: 4px; }
+        .status { font-size: 1.2em; margin-bottom: 1em; }
+        .summary { background: #e6fffa; border-left: 4px solid #38b2ac; padding: 1em; margin-bottom: 2em; }
+        .container { max-width: 1200px; margin: 0 auto; padding: 20px; background: white; box-shadow: 0 0 10px rgba(0,0,0,0.1); min-height: 100vh; }
+        .stat-card { background: #fff; border: 1px solid #dee2e6; border-radius: 8px; padding: 20px; text-align: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .stat-number { font-size: 2em; font-weight: bold; color: #2c3e50; }
+        .stat-label { color: #7f8c8d; font-size: 0.9em; margin-top: 5px; }
+        .issues-table { width: 100%; border-collapse: collapse; margin: 20px 0; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .issues-table th, .issues-table td { padding: 12px 15px; text-align: left; border-bottom: 1px solid #dee2e6; }
+        .issues-table th { background: #f8f9fa; font-weight: 600; color: #495057; position: sticky; top: 0; }
+        .issues-table tbody tr:hover { background: #f8f9fa; }
+        .level-error { color: #dc3545; font-weight: bold; }
+        .level-warning { color: #fd7e14; font-weight: bold; }
+        .level-info { color: #17a2b8; }
+        .level-style { color: #6f42c1; }
+        .package-name { font-family: 'Consolas', 'Monaco', monospace; background: #f8f9fa; padding: 4px 8px; border-radius: 4px; font-size: 0.9em; }
+        .message { max-width: 400px; word-wrap: break-word; }
+        .output-section { background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 20px; margin: 20px 0; overflow-x: auto; }
+        .output-content { font-family: 'Consolas', 'Monaco', monospace; font-size: 0.9em; line-height: 1.4; white-space: pre-wrap; }
+        .error-text { color: #dc3545; font-weight: bold; }
+        .warning-text { color: #fd7e14; font-weight: bold; }
+        .info-text { color: #17a2b8; }
+        .file-list { columns: 1; column-gap: 30px; list-style: none; }
+        .file-list li { break-inside: avoid; margin: 5px 0; font-family: 'Consolas', 'Monaco', monospace; font-size: 0.9em; background: #f8f9fa; padding: 4px 8px; border-radius: 4px; }
+        footer { margin-top: 40px; padding-top: 20px; border-top: 1px solid #dee2e6; text-align: center; color: #6c757d; font-size: 0.9em; }
+        footer a { color: #007bff; text-decoration: none; }
+        footer a:hover { text-decoration: underline; }"""
+REPORT_PAGE_FOOTER: str = """
+        <footer>
+            Generated by COSMIC Overlay QA Pipeline • 
+            <a href='https://github.com/fsvm88/cosmic-overlay'>View Repository</a>
+        </footer>
+    </div>
+</body>
+</html>"""
+# Bytes of a memory-mapped distfile passed to the hashes at a time
+HASH_CHUNK: int = 4 * 1024 * 1024
+# Page and data file name for results not tied to any category
+REPO_SECTION: str = "_repository"
+# --watch: quiet seconds after the last change before rescanning, and the
+# mtime polling interval used where inotify is unavailable
+WATCH_DEBOUNCE: float = 0.3
+WATCH_POLL_INTERVAL: float = 1.0
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+# Files outside the overlay whose changes --watch reacts to
+QA_RULE_FILES: Tuple[str, ...] = (".qaignore", ".qatolerate")
+INOTIFY_MASK: int = (
+    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+# Loads a category's issue rows on first open and renders them in batches; the
+# rows come from a <script> that sets QA_ISSUES, which unlike fetch() also
+# works when the report is opened from file://
+REPORT_SCRIPT: str = """\
+        function loadIssues(section) {
+            if (!section.open || section.dataset.loaded) return;
+            section.dataset.loaded = "1";
+            var body = section.querySelector("tbody");
+            var more = section.querySelector("button");
+            var script = document.createElement("script");
+            script.src = section.dataset.src;
+            script.onload = function () {
+                var data = window.QA_ISSUES;
+                var shown = 0;
+                function render() {
+                    var end = Math.min(shown + %d, data.rows.length);
+                    var rows = document.createDocumentFragment();
+                    for (; shown < end; shown++) {
+                        var tr = document.createElement("tr");
+                        data.rows[shown].forEach(function (value, column) {
+                            var td = document.createElement("td");
+                            td.textContent = column === 2 ? value.toUpperCase() : value;
+                            if (column === 2) td.className = "level-" + value;
+                            if (column === 4) td.className = "message";
+                            tr.appendChild(td);
+                        });
+                        rows.appendChild(tr);
+                    }
+                    body.appendChild(rows);
+                    more.hidden = shown >= data.rows.length;
+                }
+                more.onclick = render;
+                render();
+            };
+            script.onerror = function () {
+                var td = document.createElement("td");
+                td.colSpan = section.querySelectorAll("th").length;
+                td.textContent = "Could not load " + section.dataset.src;
+                body.appendChild(document.createElement("tr")).appendChild(td);
+            };
+            document.head.appendChild(script);
+        }""" % REPORT_PAGE_SIZE
+
+
+# Result of a coroutine timed by PhaseTimer.timed()
+T = TypeVar("T")
+
+GLOB_CHARS = re.compile(r"[*?\[]")
+# A compiled rule: (pinned version, atom regex, check regex); None means "any"
+RuleEntry = Tuple[
+    Optional[str], Optional["re.Pattern[str]"], Optional["re.Pattern[str]"]
+]
+
+
+class _TrieNode:
+    __slots__ = ("children", "bucket")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.bucket: Dict[str, List[RuleEntry]] = {}
+
+
+class QARuleSet:
+    """.qaignore/.qatolerate rules compiled into hash and prefix trie indexes."""
+
+    def __init__(self, rules: List[Dict[str, Optional[str]]]) -> None:
+        self._exact: Dict[str, Dict[str, List[RuleEntry]]] = {}
+        self._categories: Dict[str, Dict[str, List[RuleEntry]]] = {}
+        self._trie: _TrieNode = _TrieNode()
+        self._size: int = 0
+        for rule in rules:
+            self.add(rule["atom"], rule["ver"], rule["check"])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(
+        self, atom: Optional[str], ver: Optional[str], check: Optional[str]
+    ) -> None:
+        if not atom or not check:
+            return
+        check_re = None
+        if check != "*" and GLOB_CHARS.search(check):
+            check_re = re.compile(fnmatch.translate(check))
+            check = "*"
+        glob = GLOB_CHARS.search(atom)
+        if glob is None:
+            # A bare category only matches the category's own results
+            bucket = self._exact.setdefault(atom, {})
+            atom_re = None
+        elif atom.endswith("/*") and glob.start() == len(atom) - 1:
+            bucket = self._categories.setdefault(atom[:-2], {})
+            atom_re = None
+        else:
+            node = self._trie
+            for char in atom[: glob.start()]:
+                node = node.children.setdefault(char, _TrieNode())
+            bucket = node.bucket
+            # A single trailing "*" is fully decided by the trie prefix
+            trailing_star = glob.start() == len(atom) - 1 and atom.endswith("*")
+            atom_re = None if trailing_star else re.compile(fnmatch.translate(atom))
+        bucket.setdefault(check, []).append((ver, atom_re, check_re))
+        self._size += 1
+
+    def _bucket_matches(
+        self,
+        bucket: Dict[str, List[RuleEntry]],
+        atom: str,
+        ver: Optional[str],
+        check: str,
+    ) -> bool:
+        for key in (check, "*"):
+            for rule_ver, atom_re, check_re in bucket.get(key, ()):
+                if rule_ver and rule_ver != ver:
+                    continue
+                if atom_re is not None and not atom_re.match(atom):
+                    continue
+                if check_re is not None and not check_re.match(check):
+                    continue
+                return True
+        return False
+
+    def matches(self, atom: str, ver: Optional[str], check: str) -> bool:
+        """Return True if any rule covers the given atom, version and check."""
+        bucket = self._exact.get(atom)
+        if bucket and self._bucket_matches(bucket, atom, ver, check):
+            return True
+        category, slash, _ = atom.partition("/")
+        bucket = self._categories.get(category) if slash else None
+        if bucket and self._bucket_matches(bucket, atom, ver, check):
+            return True
+        node: Optional[_TrieNode] = self._trie
+        for char in atom:
+            if node.bucket and self._bucket_matches(node.bucket, atom, ver, check):
+                return True
+            node = node.children.get(char)
+            if node is None:
+                return False
+        return bool(node.bucket) and self._bucket_matches(node.bucket, atom, ver, check)
+
+
+class OverlayInventory:
+    """Categories, packages, ebuilds, eclasses and Manifests of an overlay."""
+
+    __slots__ = ("root", "packages", "ebuilds", "eclasses", "manifests")
+
+    def __init__(self, root: Path) -> None:
+        self.root: Path = root
+        # category -> sorted package names
+        self.packages: Dict[str, List[str]] = {}
+        self.ebuilds: List[Path] = []
+        self.eclasses: List[Path] = []
+        self.manifests: List[Path] = []
+        self._walk()
+
+    def _walk(self) -> None:
+        with os.scandir(self.root) as top:
+            top_dirs = sorted(
+                (entry for entry in top if entry.is_dir() and entry.name[0] != "."),
+                key=lambda entry: entry.name,
+            )
+        for category in top_dirs:
+            if category.name == "eclass":
+                with os.scandir(category.path) as entries:
+                    self.eclasses.extend(
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.endswith(".eclass") and entry.is_file()
+                    )
+                self.eclasses.sort()
+                continue
+            if category.name in NON_CATEGORY_DIRS:
+                continue
+            with os.scandir(category.path) as entries:
+                package_dirs = sorted(
+                    (entry for entry in entries if entry.is_dir()),
+                    key=lambda entry: entry.name,
+                )
+            for package in package_dirs:
+                with os.scandir(package.path) as entries:
+                    files = sorted(
+                        (entry for entry in entries if entry.is_file()),
+                        key=lambda entry: entry.name,
+                    )
+                ebuilds = [Path(f.path) for f in files if f.name.endswith(".ebuild")]
+                if not ebuilds:
+                    continue
+                self.packages.setdefault(category.name, []).append(package.name)
+                self.ebuilds.extend(ebuilds)
+                self.manifests.extend(
+                    Path(f.path) for f in files if f.name == "Manifest"
+                )
+
+    @property
+    def categories(self) -> List[str]:
+        return sorted(self.packages)
+
+    @property
+    def package_targets(self) -> List[str]:
+        return [
+            f"{category}/{package}"
+            for category in self.categories
+            for package in self.packages[category]
+        ]
+
+
+class PhaseTimer:
+    """Wall clock, CPU time and child process usage of each QA run phase."""
+
+    def __init__(self) -> None:
+        self.phases: List[Dict[str, Any]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        entry: Dict[str, Any] = {"phase": name}
+        # Reserve the slot now so nested phases are listed after their parent
+        self.phases.append(entry)
+        wall, cpu = time.monotonic(), time.process_time()
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        try:
+            yield
+        finally:
+            after = resource.getrusage(resource.RUSAGE_CHILDREN)
+            entry["wall_s"] = round(time.monotonic() - wall, 3)
+            entry["cpu_s"] = round(time.process_time() - cpu, 3)
+            entry["child_cpu_s"] = round(
+                after.ru_utime - before.ru_utime + after.ru_stime - before.ru_stime, 3
+            )
+            # ru_maxrss is a high-water mark (KiB on Linux): it only tells us
+            # about this phase when one of its children set a new peak
+            entry["child_peak_rss_kb"] = (
+                after.ru_maxrss if after.ru_maxrss > before.ru_maxrss else None
+            )
+
+    async def timed(self, name: str, coro: Awaitable[T]) -> T:
+        """Await coro as a concurrent sub-phase, recording only its wall time."""
+        entry: Dict[str, Any] = {"phase": name, "concurrent": True}
+        self.phases.append(entry)
+        wall = time.monotonic()
+        try:
+            return await coro
+        finally:
+            entry["wall_s"] = round(time.monotonic() - wall, 3)
+
+    def write(self, path: Path) -> None:
+        with open(path, "w") as f:
+            json.dump({"phases": self.phases}, f, indent=2)
+            f.write("\n")
+
+
+class OverlayWatcher:
+    """Blocks until files below the watched directories change (inotify or polling)."""
+
+    def __init__(self, root: Path, extra_dirs: List[Path], exclude: List[Path]) -> None:
+        self.root: Path = root
+        # Watched without descending, e.g. the directory holding .qaignore
+        self.extra_dirs: List[Path] = [d for d in extra_dirs if d != root]
+        self.exclude: Set[Path] = set(exclude)
+        self._fd: int = -1
+        # inotify watch descriptor -> (directory, watched recursively)
+        self._watches: Dict[int, Tuple[Path, bool]] = {}
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        try:
+            self._start_inotify()
+        except (OSError, AttributeError):
+            self._snapshot = self._scan()
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._fd >= 0 else "polling"
+
+    def _ignored(self, name: str) -> bool:
+        if name in QA_RULE_FILES:
+            return False
+        return name.startswith(".") or name.endswith("~")
+
+    def _walk(self, top: Path) -> Iterator[Path]:
+        """Yield top and every directory below it that is not ignored."""
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [
+                name
+                for name in dirnames
+                if not self._ignored(name) and Path(dirpath, name) not in self.exclude
+            ]
+            yield Path(dirpath)
+
+    def _start_inotify(self) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        self._add_watch_fn = libc.inotify_add_watch
+        fd = libc.inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._fd = fd
+        for directory in self._walk(self.root):
+            self._add_watch(directory, True)
+        for directory in self.extra_dirs:
+            self._add_watch(directory, False)
+
+    def _add_watch(self, directory: Path, recursive: bool) -> None:
+        wd = self._add_watch_fn(self._fd, os.fsencode(directory), INOTIFY_MASK)
+        if wd >= 0:
+            self._watches[wd] = (directory, recursive)
+
+    def _read_events(self) -> Optional[Set[str]]:
+        """Drain pending inotify events; None when the kernel queue overflowed."""
+        data = os.read(self._fd, 64 * 1024)
+        changed: Set[str] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = struct.unpack_from("iIII", data, offset)
+            name = os.fsdecode(data[offset + 16 : offset + 16 + length].rstrip(b"\0"))
+            offset += 16 + length
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            if wd not in self._watches or not name or self._ignored(name):
+                continue
+            directory, recursive = self._watches[wd]
+            path = directory / name
+            if path in self.exclude:
+                continue
+            if recursive and mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                # Files may already exist in a directory moved or copied in
+                for sub_dir in self._walk(path):
+                    self._add_watch(sub_dir, True)
+                    changed.update(str(p) for p in sub_dir.iterdir())
+            changed.add(str(path))
+        return changed
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        directories = [(d, True) for d in self._walk(self.root)]
+        directories += [(d, False) for d in self.extra_dirs]
+        for directory, _ in directories:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file() and not self._ignored(entry.name):
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _poll(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        """Return the changes seen within timeout (None waits for the first)."""
+        if self._fd >= 0:
+            while True:
+                ready, _, _ = select.select([self._fd], [], [], timeout)
+                if not ready:
+                    return set()
+                changed = self._read_events()
+                if changed is None or changed or timeout is not None:
+                    return changed
+        while True:
+            time.sleep(WATCH_POLL_INTERVAL if timeout is None else timeout)
+            snapshot = self._scan()
+            old = self._snapshot
+            self._snapshot = snapshot
+            changed = {
+                path
+                for path in old.keys() | snapshot.keys()
+                if old.get(path) != snapshot.get(path)
+            }
+            if changed or timeout is not None:
+                return changed
+
+    def wait(self, debounce: float) -> Optional[Set[str]]:
+        """Return the changed paths once quiet for debounce seconds, None if lost."""
+        changed = self._poll(None)
+        while changed is not None:
+            more = self._poll(debounce)
+            if more is None:
+                return None
+            if not more:
+                break
+            changed |= more
+        return changed
+
+
+# Module level so it can run in ProcessPoolExecutor workers
+def hash_distfile(path: str, algorithms: List[str]) -> Dict[str, str]:
+    """Hash a file with each hashlib algorithm in one pass over a memory map."""
+    hashes = {name: hashlib.new(name) for name in algorithms}
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    for offset in range(0, len(view), HASH_CHUNK):
+                        chunk = view[offset : offset + HASH_CHUNK]
+                        for digest in hashes.values():
+                            digest.update(chunk)
+                        chunk.release()
+    return {name: digest.hexdigest() for name, digest in hashes.items()}
+
+
+class ScanSink:
+    """Shared destination for the streamed results of one pkgcheck scan."""
+
+    __slots__ = (
+        "json_file",
+        "txt_file",
+        "results",
+        "errors",
+        "warnings",
+        "lines",
+        "last_progress",
+        "capture",
+        "package_results",
+    )
+
+    def __init__(self, json_file: Any, txt_file: Any, results: "QAResults") -> None:
+        self.json_file = json_file
+        self.txt_file = txt_file
+        self.results = results
+        self.errors: int = 0
+        self.warnings: int = 0
+        self.lines: int = 0
+        self.last_progress: float = time.monotonic()
+        # Raw result lines per category/package, collected for the cache
+        self.capture: Optional[Dict[str, List[str]]] = None
+        # Result lines per category/package, counted for the shard durations
+        self.package_results: Optional[Dict[str, int]] = None
+
+
+class QAIssue:
+    """A single pkgcheck result that survived .qaignore filtering."""
+
+    __slots__ = (
+        "category",
+        "package",
+        "version",
+        "level",
+        "check",
+        "message",
+        "tolerated",
+        "arch",
+    )
+
+    def __init__(
+        self,
+        category: str,
+        package: str,
+        version: str,
+        level: str,
+        check: str,
+        message: str,
+        tolerated: bool = False,
+        arch: str = "",
+    ) -> None:
+        self.category = category
+        self.package = package
+        self.version = version
+        self.level = level
+        self.check = check
+        self.message = message
+        self.tolerated = tolerated
+        # Matrix entries that reported the issue, comma-separated
+        self.arch = arch
+
+    @property
+    def atom(self) -> str:
+        return f"{self.category}/{self.package}" if self.package else self.category
+
+
+class QAResults:
+    """Parsed and filtered QA results, built once per run and shared by all reports."""
+
+    __slots__ = ("qa_tool", "issues", "counts", "ignored", "tolerated")
+
+    def __init__(self, qa_tool: str = "basic") -> None:
+        self.qa_tool: str = qa_tool
+        self.issues: List[QAIssue] = []
+        self.counts: Dict[str, int] = dict.fromkeys(LEVELS, 0)
+        self.ignored: Dict[str, int] = dict.fromkeys(LEVELS, 0)
+        self.tolerated: Dict[str, int] = dict.fromkeys(LEVELS, 0)
+
+    @property
+    def errors(self) -> int:
+        return self.counts["error"]
+
+    @property
+    def warnings(self) -> int:
+        return self.counts["warning"]
+
+    @property
+    def total_issues(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def ignored_total(self) -> int:
+        return sum(self.ignored.values())
+
+    @property
+    def tolerated_total(self) -> int:
+        return sum(self.tolerated.values())
+
+    @property
+    def show_minor_levels(self) -> bool:
+        """Whether the info/style lines are worth showing in summaries."""
+        return (
+            self.counts["style"] > 0
+            or self.ignored["info"] > 0
+            or self.ignored["style"] > 0
+            or self.tolerated["info"] > 0
+            or self.tolerated["style"] > 0
+        )
+
+    def level_summary(self, level: str) -> str:
+        return (
+            f"{self.counts[level]} "
+            f"[{self.ignored[level]} ignored, {self.tolerated[level]} tolerated]"
+        )
+
+    def total_summary(self) -> str:
+        return (
+            f"{self.total_issues} "
+            f"[{self.ignored_total} ignored, {self.tolerated_total} tolerated]"
+        )
+
+
+class QAOptions:
+    """Optional SimpleQAChecker settings, mirroring the command line options."""
+
+    since: Optional[str] = None
+    fail_fast: bool = False
+    pkgcheck_timeout: Optional[float] = None
+    pkgdev_timeout: Optional[float] = None
+    jobs: int = 1
+    cache: bool = False
+    cache_size_mb: int = 64
+    baseline: Optional[str] = None
+    history_db: Optional[str] = None
+    tools_dir: Optional[str] = None
+    backend: str = "process"
+    distdir: Optional[str] = None
+    matrix: Optional[List[str]] = None
+
+    def __init__(self, **options: Any) -> None:
+        for name, value in options.items():
+            if not hasattr(QAOptions, name):
+                raise TypeError(f"Unknown QA option: {name}")
+            setattr(self, name, value)
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "QAOptions":
+        return cls(
+            since=args.since,
+            fail_fast=args.fail_fast,
+            pkgcheck_timeout=args.pkgcheck_timeout,
+            pkgdev_timeout=args.pkgdev_timeout,
+            jobs=args.jobs,
+            cache=args.cache,
+            cache_size_mb=args.cache_size,
+            baseline=args.baseline,
+            history_db=args.history_db,
+            tools_dir=args.tools_dir,
+            backend=args.backend,
+            distdir=args.distdir,
+            matrix=(
+                [entry.strip() for entry in args.matrix.split(",") if entry.strip()]
+                if args.matrix is not None
+                else None
+            ),
+        )
 
 
 class SimpleQAChecker:
@@ -54,16 +728,97 @@ class SimpleQAChecker:
         self._msg(message, "SUCCESS")
 
     def __init__(
-        self, overlay_root: str, reports_dir: str, config: Optional[str] = None
+        self,
+        overlay_root: str,
+        reports_dir: str,
+        config: Optional[str] = None,
+        options: Optional[QAOptions] = None,
     ) -> None:
+        options = options or QAOptions()
         self.overlay_root: Path = Path(overlay_root)
         # Always use qa-reports subfolder from current working directory
         self.reports_dir: Path = Path.cwd() / "qa-reports"
         # Search for pkgcheck.conf in order: script folder, parent folder, cwd, system default
         self.config: Optional[Path] = self._find_config(config)
         self.has_portage: bool = self._which("emerge")
-        self.has_pkgcheck: bool = self._which("pkgcheck")
-        self.has_pkgdev: bool = self._which("pkgdev")
+        # Directory searched before PATH for pkgcheck/pkgdev, e.g. the
+        # stand-ins installed by qa-fake-tools.py
+        self.tools_dir: Optional[Path] = (
+            Path(options.tools_dir).resolve() if options.tools_dir else None
+        )
+        self.pkgcheck_bin: str = self._tool_path("pkgcheck")
+        self.pkgdev_bin: str = self._tool_path("pkgdev")
+        self.has_pkgcheck: bool = self._which(self.pkgcheck_bin)
+        # In-process pkgcheck for backend="api", None runs pkgcheck processes
+        self.pkgcheck_api: Optional[PkgcheckAPI] = None
+        if options.backend == "api":
+            try:
+                self.pkgcheck_api = PkgcheckAPI()
+                self.has_pkgcheck = True
+            except ImportError as e:
+                self._log(f"pkgcheck Python API unusable ({e}), running pkgcheck")
+        self.has_pkgdev: bool = self._which(self.pkgdev_bin)
+        # Local distfiles to verify Manifest DIST entries against, if any
+        self.distdir: Optional[Path] = (
+            Path(options.distdir) if options.distdir else None
+        )
+        # Git ref for incremental mode; None scans the whole overlay
+        self.since: Optional[str] = options.since
+        self.scan_scope: str = "full overlay"
+        # Stop at the first error not covered by .qaignore/.qatolerate
+        self.fail_fast: bool = options.fail_fast
+        self.aborted: bool = False
+        # Per-tool time limits in seconds; None waits indefinitely
+        self.pkgcheck_timeout: Optional[float] = options.pkgcheck_timeout
+        self.pkgdev_timeout: Optional[float] = options.pkgdev_timeout
+        # Concurrent per-package pkgcheck shards; 1 runs a single scan
+        self.jobs: int = options.jobs if options.jobs > 0 else (os.cpu_count() or 1)
+        # "ARCH[:PROFILE]" entries scanned as concurrent pkgcheck jobs; an
+        # empty list uses the arches of pkgcheck.conf, None scans once
+        self.matrix: Optional[List[str]] = (
+            (options.matrix or self._config_arches())
+            if options.matrix is not None
+            else None
+        )
+        # Per-package result cache, keyed by _package_fingerprint()
+        self.cache: Optional[QACache] = (
+            QACache(
+                self.reports_dir / ".cache" / "pkgcheck", options.cache_size_mb << 20
+            )
+            if options.cache
+            else None
+        )
+        self._cache_salt: Optional[str] = None
+        self._eclass_inherits: Optional[Dict[str, Set[str]]] = None
+        self._inventory: Optional[OverlayInventory] = None
+        self._last_exit_codes: Dict[str, int] = {}
+        # Every run is stored here; baseline is the git ref to diff against.
+        # Kept out of the reports, which are published
+        self.history: QAHistory = QAHistory(
+            Path(options.history_db)
+            if options.history_db
+            else Path.cwd() / ".cache" / "qa-history.sqlite3"
+        )
+        self.baseline: Optional[str] = options.baseline
+        # Per-phase timings of run_full_qa_check, written to timings.json
+        self.timings: PhaseTimer = PhaseTimer()
+        self._last_capture: Dict[str, List[str]] = {}
+        # Parsed once per run, see get_qa_results()
+        self._rules: Optional[Tuple[QARuleSet, QARuleSet]] = None
+        self._qa_results: Optional[QAResults] = None
+        # --watch: result lines of the last scan by category/package (or
+        # category/REPO_SECTION for results outside packages)
+        self.watch_results: Optional[Dict[str, List[str]]] = None
+
+    def _config_arches(self) -> List[str]:
+        """Arches set in pkgcheck.conf, for the default scan matrix."""
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(self.config or [])
+        except configparser.Error as e:
+            self._error(f"Could not parse {self.config}: {e}")
+        arches = parser.get(configparser.DEFAULTSECT, "arches", fallback="")
+        return [arch.strip() for arch in arches.split(",") if arch.strip()]
 
     def _find_config(self, config: Optional[str]) -> Optional[Path]:
         if config:
@@ -79,12 +834,206 @@ class SimpleQAChecker:
                 return conf_path
         return None
 
+    def _tool_path(self, tool: str) -> str:
+        """Return tool from tools_dir when present there, else the bare name."""
+        if self.tools_dir is not None:
+            candidate = self.tools_dir / tool
+            if os.access(candidate, os.X_OK):
+                return str(candidate)
+        return tool
+
     def _which(self, tool: str) -> bool:
         for path in os.environ.get("PATH", "").split(os.pathsep):
             if os.access(os.path.join(path, tool), os.X_OK):
                 return True
         return False
 
+    def get_inventory(self) -> OverlayInventory:
+        """Walk the overlay once and return the shared inventory."""
+        if self._inventory is None:
+            self._inventory = OverlayInventory(self.overlay_root)
+        return self._inventory
+
+    def _git_lines(self, args: List[str]) -> Optional[List[str]]:
+        """Run a git command in the overlay and return its non-empty output lines."""
+        try:
+            result = subprocess.run(
+                ["git"] + args,
+                capture_output=True,
+                text=True,
+                cwd=self.overlay_root,
+            )
+        except Exception:
+            return None
+        if result.returncode != 0:
+            return None
+        return [line for line in result.stdout.splitlines() if line.strip()]
+
+    def _inherited_eclasses(self, path: Path) -> Set[str]:
+        """Return the eclass names listed on the inherit lines of an ebuild/eclass."""
+        names: Set[str] = set()
+        try:
+            with open(path) as f:
+                for line in f:
+                    match = INHERIT_RE.match(line)
+                    if match:
+                        names.update(match.group(1).split())
+        except IOError:
+            pass
+        return names
+
+    def _packages_inheriting(self, eclasses: Set[str]) -> Set[str]:
+        """Return category/package targets inheriting any of the given eclasses."""
+        affected: Set[str] = set(eclasses)
+        eclass_inherits = self._get_eclass_inherits()
+        grown = True
+        while grown:
+            grown = False
+            for name, inherits in eclass_inherits.items():
+                if name not in affected and inherits & affected:
+                    affected.add(name)
+                    grown = True
+        packages: Set[str] = set()
+        for ebuild in self.get_inventory().ebuilds:
+            if self._inherited_eclasses(ebuild) & affected:
+                packages.add(f"{ebuild.parent.parent.name}/{ebuild.parent.name}")
+        return packages
+
+    def _get_eclass_inherits(self) -> Dict[str, Set[str]]:
+        """Map each overlay eclass to the eclasses it inherits, parsed once."""
+        if self._eclass_inherits is None:
+            self._eclass_inherits = {
+                path.stem: self._inherited_eclasses(path)
+                for path in self.get_inventory().eclasses
+            }
+        return self._eclass_inherits
+
+    def _eclass_closure(self, eclasses: Set[str]) -> Set[str]:
+        """Return the given eclasses plus everything they inherit, transitively."""
+        eclass_inherits = self._get_eclass_inherits()
+        closure: Set[str] = set()
+        pending: List[str] = list(eclasses)
+        while pending:
+            name = pending.pop()
+            if name not in closure:
+                closure.add(name)
+                pending.extend(eclass_inherits.get(name, ()))
+        return closure
+
+    def _get_cache_salt(self) -> str:
+        """Hash the inputs shared by every package: tool version, config, profiles."""
+        if self._cache_salt is None:
+            digest = hashlib.sha256()
+            try:
+                version = (
+                    self.pkgcheck_api.version
+                    if self.pkgcheck_api is not None
+                    else subprocess.run(
+                        [self.pkgcheck_bin, "--version"],
+                        capture_output=True,
+                        text=True,
+                    ).stdout
+                )
+            except Exception:
+                version = ""
+            digest.update(version.encode())
+            if self.config and self.config.is_file():
+                digest.update(self.config.read_bytes())
+            metadata_dir = str(self.overlay_root / "metadata")
+            for directory in ["metadata", "profiles"]:
+                for dirpath, dirnames, filenames in os.walk(
+                    self.overlay_root / directory
+                ):
+                    if dirpath == metadata_dir:
+                        # Generated by --regen, which must not void the cache
+                        dirnames[:] = [
+                            name for name in dirnames if name not in METADATA_CACHE_DIRS
+                        ]
+                    dirnames.sort()
+                    for name in sorted(filenames):
+                        path = Path(dirpath, name)
+                        digest.update(str(path.relative_to(self.overlay_root)).encode())
+                        digest.update(path.read_bytes())
+            self._cache_salt = digest.hexdigest()
+        return self._cache_salt
+
+    def _repo_fingerprint(self, keys: Dict[str, str]) -> str:
+        """Hash every package fingerprint, eclass and category metadata.xml."""
+        inventory = self.get_inventory()
+        digest = hashlib.sha256(self._get_cache_salt().encode())
+        for target, key in sorted(keys.items()):
+            digest.update(f"{target}:{key}\n".encode())
+        for path in inventory.eclasses:
+            digest.update(b"\0eclass:" + path.name.encode() + b"\0")
+            digest.update(path.read_bytes())
+        for category in inventory.categories:
+            metadata = self.overlay_root / category / "metadata.xml"
+            if metadata.is_file():
+                digest.update(b"\0" + category.encode() + b"\0")
+                digest.update(metadata.read_bytes())
+        return digest.hexdigest()
+
+    def _package_fingerprint(self, target: str) -> str:
+        """Hash a package's ebuilds, files/, Manifest, metadata.xml and eclasses."""
+        digest = hashlib.sha256(self._get_cache_salt().encode())
+        digest.update(target.encode())
+        package_dir = self.overlay_root / target
+        eclasses: Set[str] = set()
+        for path in sorted(package_dir.rglob("*")):
+            if not path.is_file():
+                continue
+            digest.update(b"\0" + str(path.relative_to(package_dir)).encode() + b"\0")
+            digest.update(path.read_bytes())
+            if path.suffix == ".ebuild":
+                eclasses |= self._inherited_eclasses(path)
+        for name in sorted(self._eclass_closure(eclasses)):
+            digest.update(b"\0eclass:" + name.encode() + b"\0")
+            eclass_path = self.overlay_root / "eclass" / f"{name}.eclass"
+            if eclass_path.is_file():
+                digest.update(eclass_path.read_bytes())
+        return digest.hexdigest()
+
+    def get_changed_targets(self, since: str) -> Optional[List[str]]:
+        """Map files changed since a git ref to targets; None means a full scan."""
+        changed = self._git_lines(["diff", "--name-only", "--relative", since])
+        if changed is None:
+            self._error(f"Could not diff against {since} - falling back to full scan")
+            return None
+        untracked = self._git_lines(["ls-files", "--others", "--exclude-standard"])
+        return self._targets_for_paths(changed + (untracked or []))
+
+    def _targets_for_paths(self, rel_paths: List[str]) -> Optional[List[str]]:
+        """Map overlay-relative paths to targets; None means a full scan."""
+        targets: Set[str] = set()
+        eclasses: Set[str] = set()
+        # Only packages the inventory knows about: not removed ones, nor
+        # directories such as qa-reports/categories that hold no ebuild
+        packages = set(self.get_inventory().package_targets)
+        for rel_path in rel_paths:
+            parts: List[str] = rel_path.split("/")
+            if (
+                len(parts) > 2
+                and parts[0] == "metadata"
+                and (parts[1] in METADATA_CACHE_DIRS)
+            ):
+                # Written by --regen, not read by any check
+                continue
+            if parts[0] in REPO_WIDE_DIRS:
+                self._log(f"{rel_path} changed - falling back to full scan")
+                return None
+            if parts[0] == "eclass":
+                if rel_path.endswith(".eclass"):
+                    eclasses.add(Path(rel_path).stem)
+                continue
+            if len(parts) < 3 or parts[0].startswith("."):
+                continue
+            if f"{parts[0]}/{parts[1]}" in packages:
+                targets.add(f"{parts[0]}/{parts[1]}")
+        if eclasses:
+            self._log(f"Changed eclasses: {', '.join(sorted(eclasses))}")
+            targets.update(self._packages_inheriting(eclasses))
+        return sorted(targets)
+
     def parse_qaignore(self, ignore_path: Path) -> List[Dict[str, Optional[str]]]:
         rules: List[Dict[str, Optional[str]]] = []
         if not ignore_path.exists():
@@ -106,32 +1055,6 @@ class SimpleQAChecker:
                 rules.append({"atom": atom, "ver": ver, "check": check})
         return rules
 
-    def should_ignore(
-        self,
-        atom: str,
-        ver: Optional[str],
-        check: str,
-        rules: List[Dict[str, Optional[str]]],
-    ) -> bool:
-        for rule in rules:
-            if not self._fnmatch(atom, rule["atom"]):
-                continue
-            if rule["ver"] and rule["ver"] != ver:
-                continue
-            if rule["check"] != "*" and rule["check"] != check:
-                continue
-            return True
-        return False
-
-    def _fnmatch(self, value: str, pattern: Optional[str]) -> bool:
-        if pattern is None:
-            return False
-        if pattern == "*":
-            return True
-        if pattern.endswith("*"):
-            return value.startswith(pattern[:-1])
-        return value == pattern
-
     def parse_qatolerate(self, tolerate_path: Path) -> List[Dict[str, Optional[str]]]:
         rules: List[Dict[str, Optional[str]]] = []
         if not tolerate_path.exists():
@@ -153,91 +1076,14 @@ class SimpleQAChecker:
                 rules.append({"atom": atom, "ver": ver, "check": check})
         return rules
 
-    def should_tolerate(
-        self,
-        atom: str,
-        ver: Optional[str],
-        check: str,
-        rules: List[Dict[str, Optional[str]]],
-    ) -> bool:
-        for rule in rules:
-            if not self._fnmatch(atom, rule["atom"]):
-                continue
-            if rule["ver"] and rule["ver"] != ver:
-                continue
-            if rule["check"] != "*" and rule["check"] != check:
-                continue
-            return True
-        return False
-
-    def filter_issues_with_qaignore_and_qatolerate(
-        self, issues: List[Dict[str, Any]]
-    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-        ignore_path: Path = Path.cwd() / ".qaignore"
-        tolerate_path: Path = Path.cwd() / ".qatolerate"
-        ignore_rules: List[Dict[str, Optional[str]]] = self.parse_qaignore(ignore_path)
-        tolerate_rules: List[Dict[str, Optional[str]]] = self.parse_qatolerate(
-            tolerate_path
-        )
-        filtered: List[Dict[str, Any]] = []
-        tolerated: List[Dict[str, Any]] = []
-        for issue in issues:
-            atom: str = issue.get("atom", "")
-            ver: Optional[str] = issue.get("version")
-            check: str = issue.get("check", "")
-            if self.should_ignore(atom, ver, check, ignore_rules):
-                continue
-            if self.should_tolerate(atom, ver, check, tolerate_rules):
-                tolerated.append(issue)
-            else:
-                filtered.append(issue)
-        return filtered, tolerated
-
-    def _get_package_issues(self) -> List[Dict[str, str]]:
-        """Parse package issues from QA output files and filter with .qaignore."""
-        issues: List[Dict[str, str]] = []
-        # Only parse pkgcheck-scan.txt for package issues
-        filename = "pkgcheck-scan.txt"
-        filepath = self.reports_dir / filename
-        if filepath.exists():
-            try:
-                with open(filepath) as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        match = re.match(
-                            r"^([^:]+):\s*(ERROR|WARNING|INFO|STYLE):\s*(.+)$",
-                            line,
-                        )
-                        if match:
-                            # Try to extract check name from message
-                            msg = match.group(3)
-                            check_match = re.match(r"([A-Za-z0-9_]+):", msg)
-                            check = check_match.group(1) if check_match else ""
-                            issues.append(
-                                {
-                                    "package": match.group(1),
-                                    "level": match.group(2).lower(),
-                                    "message": msg,
-                                    "tool": "pkgcheck",
-                                    "check": check,
-                                    "atom": match.group(1),
-                                    "version": None,
-                                }
-                            )
-                filtered, tolerated = self.filter_issues_with_qaignore_and_qatolerate(
-                    issues
-                )
-                # Return both, but mark tolerated issues
-                for issue in tolerated:
-                    issue["tolerated"] = True
-                for issue in filtered:
-                    issue["tolerated"] = False
-                return filtered + tolerated
-            except IOError:
-                pass
-        return issues
+    def _get_rules(self) -> Tuple[QARuleSet, QARuleSet]:
+        """Return the compiled .qaignore and .qatolerate rules, built only once."""
+        if self._rules is None:
+            self._rules = (
+                QARuleSet(self.parse_qaignore(Path.cwd() / ".qaignore")),
+                QARuleSet(self.parse_qatolerate(Path.cwd() / ".qatolerate")),
+            )
+        return self._rules
 
     def check_requirements(self) -> bool:
         """Check if required tools are available."""
@@ -265,53 +1111,179 @@ class SimpleQAChecker:
         # All checks passed
         return True
 
-    def generate_markdown_report(self) -> None:
+    def _copy_first_output(self, out: io.TextIOBase, filenames: List[str]) -> bool:
+        """Stream the first readable report file into out; False if none."""
+        for filename in filenames:
+            filepath = self.reports_dir / filename
+            if filepath.exists():
+                try:
+                    with open(filepath, errors="replace") as f:
+                        shutil.copyfileobj(f, out)
+                    return True
+                except IOError:
+                    continue
+        return False
+
+    def _escape_first_output(self, out: io.TextIOBase, filenames: List[str]) -> bool:
+        """Like _copy_first_output, HTML-escaping line by line."""
+        for filename in filenames:
+            filepath = self.reports_dir / filename
+            if filepath.exists():
+                try:
+                    with open(filepath, errors="replace") as f:
+                        for line in f:
+                            out.write(self._escape_html(line))
+                    return True
+                except IOError:
+                    continue
+        return False
+
+    def _html_head(self, title: str) -> str:
+        return f"""<!DOCTYPE html>
+<html lang='en'>
+<head>
+    <meta charset='UTF-8'>
+    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+    <title>{title}</title>
+    <style>
+{REPORT_STYLE}
+    </style>
+</head>
+<body>
+    <div class='container'>"""
+
+    def _category_counts(self, results: QAResults) -> Dict[str, Dict[str, int]]:
+        """Count issues per category and level in one pass over the results."""
+        counts: Dict[str, Dict[str, int]] = {}
+        for issue in results.issues:
+            category = issue.category or REPO_SECTION
+            if category not in counts:
+                counts[category] = dict.fromkeys(LEVELS, 0)
+            counts[category][issue.level] = counts[category].get(issue.level, 0) + 1
+        return counts
+
+    def _write_category_data(self, results: QAResults, data_dir: Path) -> None:
+        """Write each category's issue rows to categories/<category>.js."""
+        files: Dict[str, io.TextIOBase] = {}
+        try:
+            for issue in results.issues:
+                category = issue.category or REPO_SECTION
+                out = files.get(category)
+                if out is None:
+                    out = open(
+                        data_dir / f"{category}.js", "w", buffering=REPORT_BUFFER
+                    )
+                    out.write('var QA_ISSUES = {"rows":[')
+                    files[category] = out
+                else:
+                    out.write(",")
+                row = [
+                    issue.package,
+                    issue.version,
+                    issue.level,
+                    issue.check,
+                    issue.message,
+                ]
+                if self.matrix:
+                    row.append(issue.arch)
+                out.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+        finally:
+            for out in files.values():
+                out.write("]};\n")
+                out.close()
+
+    def _write_category_page(
+        self,
+        category: str,
+        counts: Dict[str, int],
+        ebuilds: List[str],
+        page_dir: Path,
+    ) -> None:
+        title = (
+            "Repository-wide results"
+            if category == REPO_SECTION
+            else f"{self._escape_html(category)}/"
+        )
+        total = sum(counts.values())
+        arch_header = "<th>Arch</th>" if self.matrix else ""
+        with open(page_dir / f"{category}.html", "w", buffering=REPORT_BUFFER) as out:
+            out.write(self._html_head(f"{title} - COSMIC Overlay QA Report"))
+            out.write(f"""
+        <h1>{title}</h1>
+        <p><a href='../index.html'>← Back to report</a></p>
+        <div class='stats-row' style='margin: 1em 0; font-size: 1.1em;'>
+            {" &nbsp;| ".join(f"<strong>{level.capitalize()}:</strong> {counts.get(level, 0)}" for level in LEVELS)}
+        </div>""")
+            if total:
+                out.write(f"""
+        <details data-src='{category}.js' ontoggle='loadIssues(this)'>
+            <summary><strong>Issues ({total})</strong></summary>
+            <table class='issues-table'><thead><tr><th>Package</th><th>Version</th><th>Level</th><th>Check</th><th>Message</th>{arch_header}</tr></thead><tbody></tbody></table>
+            <button type='button' hidden>Show more</button>
+        </details>""")
+            else:
+                out.write("\n        <p>No issues reported.</p>")
+            if ebuilds:
+                out.write("\n        <h2>📄 Files Checked</h2><ul class='file-list'>")
+                for ebuild in ebuilds:
+                    out.write(f"<li>{self._escape_html(ebuild)}</li>\n")
+                out.write("</ul>")
+            out.write(
+                f"\n        <script>\n{REPORT_SCRIPT}\n        </script>"
+                + REPORT_PAGE_FOOTER
+            )
+
+    def _timing_rows(self) -> List[Tuple[str, str, str, str, str]]:
+        """Format the phases finished so far as report table rows."""
+        rows: List[Tuple[str, str, str, str, str]] = []
+        for entry in self.timings.phases:
+            if "wall_s" not in entry:
+                continue
+            if entry.get("concurrent"):
+                name, wall = f"↳ {entry['phase']}", f"{entry['wall_s']:.2f}"
+                rows.append((name, wall, "", "", ""))
+                continue
+            rss = entry["child_peak_rss_kb"]
+            rows.append(
+                (
+                    entry["phase"],
+                    f"{entry['wall_s']:.2f}",
+                    f"{entry['cpu_s']:.2f}",
+                    f"{entry['child_cpu_s']:.2f}" if entry["child_cpu_s"] else "",
+                    f"{rss / 1024:.1f}" if rss else "",
+                )
+            )
+        return rows
+
+    def generate_markdown_report(self, results: QAResults) -> None:
         output_path = self.reports_dir / "report.md"
+        inventory = self.get_inventory()
         commit_sha = self._get_commit_sha()
         commit_sha_short = commit_sha[:8] if commit_sha else "unknown"
         workflow = os.environ.get("GITHUB_WORKFLOW", "Manual")
         report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-        (
-            total_issues,
-            errors,
-            warnings,
-            info,
-            style,
-            qa_tool,
-            ignored_errors,
-            ignored_warnings,
-            ignored_info,
-            ignored_style,
-            ignored_total,
-            tolerated_errors,
-            tolerated_warnings,
-            tolerated_info,
-            tolerated_style,
-            tolerated_total,
-        ) = self.get_qa_results()
-        content = f"""# 🚀 COSMIC Overlay QA Report
+        with open(output_path, "w", buffering=REPORT_BUFFER) as out:
+            out.write(f"""# 🚀 COSMIC Overlay QA Report
 
 **Generated:** {report_date}  
 **Commit:** `{commit_sha_short}`  
 **Workflow:** {workflow}  
-**QA Tool:** {qa_tool}
+**QA Tool:** {results.qa_tool}  
+**Scope:** {self.scan_scope}
 
-## Status: {'❌ FAILED' if errors > 0 else '⚠️ WARNINGS' if warnings > 0 else '✅ PASSED'}
+## Status: {'❌ FAILED' if results.errors > 0 else '⚠️ WARNINGS' if results.warnings > 0 else '✅ PASSED'}
 
 ### 📊 Summary
 
-- **Total Issues:** {total_issues} [{ignored_total} ignored, {tolerated_total} tolerated]
-- **Errors:** {errors} [{ignored_errors} ignored, {tolerated_errors} tolerated]
-- **Warnings:** {warnings} [{ignored_warnings} ignored, {tolerated_warnings} tolerated]"""
-        if (
-            style > 0
-            or ignored_info > 0
-            or ignored_style > 0
-            or tolerated_info > 0
-            or tolerated_style > 0
-        ):
-            content += f"\n- **Info:** {info} [{ignored_info} ignored, {tolerated_info} tolerated]\n- **Style:** {style} [{ignored_style} ignored, {tolerated_style} tolerated]"
-        content += """
+- **Total Issues:** {results.total_summary()}
+- **Errors:** {results.level_summary("error")}
+- **Warnings:** {results.level_summary("warning")}""")
+            if results.show_minor_levels:
+                out.write(
+                    f"\n- **Info:** {results.level_summary('info')}"
+                    f"\n- **Style:** {results.level_summary('style')}"
+                )
+            out.write("""
 
 ---
 
@@ -320,92 +1292,64 @@ class SimpleQAChecker:
 ### QA Scan Output
 
 ```
-"""
-        for filename in ["pkgcheck-scan.txt", "repoman-full.txt", "basic-qa.txt"]:
-            filepath = self.reports_dir / filename
-            if filepath.exists():
-                try:
-                    with open(filepath) as f:
-                        content += f.read()
-                    break
-                except IOError:
-                    continue
-        else:
-            content += f"No detailed QA output available\nChecked {len(list(self.overlay_root.glob('**/*.ebuild')))} ebuilds in overlay\n"
-        content += """
+""")
+            if not self._copy_first_output(
+                out, ["pkgcheck-scan.txt", "repoman-full.txt", "basic-qa.txt"]
+            ):
+                out.write(
+                    "No detailed QA output available\n"
+                    f"Checked {len(inventory.ebuilds)} ebuilds in overlay\n"
+                )
+            out.write("""
 ```
 
 ### Package Checks
 
 ```
-"""
-        for filename in ["package-checks.txt", "category-checks.txt"]:
-            filepath = self.reports_dir / filename
-            if filepath.exists():
-                try:
-                    with open(filepath) as f:
-                        content += f.read()
-                    break
-                except IOError:
-                    continue
-        else:
-            content += "No package checks output available"
-        content += """
-```
-
+""")
+            if not self._copy_first_output(
+                out, ["package-checks.txt", "category-checks.txt"]
+            ):
+                out.write("No package checks output available")
+            out.write("\n```\n")
+            if self.distdir is not None:
+                out.write("\n### Distfiles\n\n```\n")
+                if not self._copy_first_output(out, ["distfiles-check.txt"]):
+                    out.write("No distfile check output available")
+                out.write("\n```\n")
+            out.write("""
+## ⏱️ Phase Timings
+
+| Phase | Wall (s) | CPU (s) | Child CPU (s) | Child Peak RSS (MiB) |
+|-------|---------:|--------:|--------------:|---------------------:|
+""")
+            for row in self._timing_rows():
+                out.write(f"| {' | '.join(row)} |\n")
+            out.write("""
 ## 📊 Package Statistics
 
-"""
-        for category in [
-            "cosmic-base",
-            "acct-group",
-            "acct-user",
-            "dev-util",
-            "virtual",
-            "x11-themes",
-        ]:
-            category_path = self.overlay_root / category
-            if category_path.is_dir():
-                pkg_count = len([d for d in category_path.iterdir() if d.is_dir()])
-                content += f"- **{category}/:** {pkg_count} packages\n"
-        content += """
+""")
+            for category in inventory.categories:
+                pkg_count = len(inventory.packages[category])
+                out.write(f"- **{category}/:** {pkg_count} packages\n")
+            out.write("""
 
 ## 📄 Files Checked
 
-"""
-        ebuilds = sorted(self.overlay_root.glob("**/*.ebuild"))
-        for ebuild in ebuilds:
-            rel_path = ebuild.relative_to(self.overlay_root)
-            content += f"- `{rel_path}`\n"
-        with open(output_path, "w") as f:
-            f.write(content)
+""")
+            for ebuild in inventory.ebuilds:
+                out.write(f"- `{ebuild.relative_to(self.overlay_root)}`\n")
         self._log(f"Markdown report generated: {output_path}")
 
-    def generate_html_report(self) -> None:
+    def generate_html_report(self, results: QAResults) -> None:
+        """Write index.html plus one page and one data script per category."""
         output_path = self.reports_dir / "index.html"
+        inventory = self.get_inventory()
         commit_sha = self._get_commit_sha()
         commit_sha_short = commit_sha[:8] if commit_sha else "unknown"
         workflow = os.environ.get("GITHUB_WORKFLOW", "Manual")
         report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-        (
-            total_issues,
-            errors,
-            warnings,
-            info,
-            style,
-            qa_tool,
-            ignored_errors,
-            ignored_warnings,
-            ignored_info,
-            ignored_style,
-            ignored_total,
-            tolerated_errors,
-            tolerated_warnings,
-            tolerated_info,
-            tolerated_style,
-            tolerated_total,
-        ) = self.get_qa_results()
-        package_issues = self._get_package_issues()
+        errors, warnings = results.errors, results.warnings
         status_text = (
             "FAILED" if errors > 0 else "WARNINGS" if warnings > 0 else "PASSED"
         )
@@ -415,174 +1359,107 @@ class SimpleQAChecker:
             else "status-warning" if warnings > 0 else "status-success"
         )
         status_icon = "❌" if errors > 0 else "⚠️" if warnings > 0 else "✅"
-        html_content = f"""<!DOCTYPE html>
-<html lang='en'>
-<head>
-    <meta charset='UTF-8'>
-    <meta name='viewport' content='width=device-width, initial-scale=1.0'>
-    <title>COSMIC Overlay QA Report</title>
-    <style>
-        body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 2em; background: #f8f9fa; }}
-        h1, h2, h3 {{ color: #2d3748; }}
-        pre {{ background: #eee; padding: 1em; border-radius: 6px; }}
-        code {{ background: #e2e8f0; padding: 2px 4px; border-radius: 4px; }}
-        .status {{ font-size: 1.2em; margin-bottom: 1em; }}
-        .summary {{ background: #e6fffa; border-left: 4px solid #38b2ac; padding: 1em; margin-bottom: 2em; }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 20px; background: white; box-shadow: 0 0 10px rgba(0,0,0,0.1); min-height: 100vh; }}
-        .stat-card {{ background: #fff; border: 1px solid #dee2e6; border-radius: 8px; padding: 20px; text-align: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .stat-number {{ font-size: 2em; font-weight: bold; color: #2c3e50; }}
-        .stat-label {{ color: #7f8c8d; font-size: 0.9em; margin-top: 5px; }}
-        .issues-table {{ width: 100%; border-collapse: collapse; margin: 20px 0; background: white; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .issues-table th, .issues-table td {{ padding: 12px 15px; text-align: left; border-bottom: 1px solid #dee2e6; }}
-        .issues-table th {{ background: #f8f9fa; font-weight: 600; color: #495057; position: sticky; top: 0; }}
-        .issues-table tbody tr:hover {{ background: #f8f9fa; }}
-        .level-error {{ color: #dc3545; font-weight: bold; }}
-        .level-warning {{ color: #fd7e14; font-weight: bold; }}
-        .level-info {{ color: #17a2b8; }}
-        .level-style {{ color: #6f42c1; }}
-        .package-name {{ font-family: 'Consolas', 'Monaco', monospace; background: #f8f9fa; padding: 4px 8px; border-radius: 4px; font-size: 0.9em; }}
-        .message {{ max-width: 400px; word-wrap: break-word; }}
-        .output-section {{ background: #f8f9fa; border: 1px solid #e9ecef; border-radius: 8px; padding: 20px; margin: 20px 0; overflow-x: auto; }}
-        .output-content {{ font-family: 'Consolas', 'Monaco', monospace; font-size: 0.9em; line-height: 1.4; white-space: pre-wrap; }}
-        .error-text {{ color: #dc3545; font-weight: bold; }}
-        .warning-text {{ color: #fd7e14; font-weight: bold; }}
-        .info-text {{ color: #17a2b8; }}
-        .file-list {{ columns: 1; column-gap: 30px; list-style: none; }}
-        .file-list li {{ break-inside: avoid; margin: 5px 0; font-family: 'Consolas', 'Monaco', monospace; font-size: 0.9em; background: #f8f9fa; padding: 4px 8px; border-radius: 4px; }}
-        footer {{ margin-top: 40px; padding-top: 20px; border-top: 1px solid #dee2e6; text-align: center; color: #6c757d; font-size: 0.9em; }}
-        footer a {{ color: #007bff; text-decoration: none; }}
-        footer a:hover {{ text-decoration: underline; }}
-    </style>
-</head>
-<body>
-    <div class='container'>
+
+        page_dir = self.reports_dir / "categories"
+        # Pages of categories that no longer exist would otherwise linger
+        shutil.rmtree(page_dir, ignore_errors=True)
+        page_dir.mkdir(parents=True)
+        counts = self._category_counts(results)
+        self._write_category_data(results, page_dir)
+        ebuilds: Dict[str, List[str]] = {}
+        for ebuild in inventory.ebuilds:
+            rel_path = ebuild.relative_to(self.overlay_root)
+            ebuilds.setdefault(rel_path.parts[0], []).append(str(rel_path))
+        categories = sorted(set(inventory.categories) | set(counts))
+        if REPO_SECTION in counts:
+            categories.remove(REPO_SECTION)
+            categories.insert(0, REPO_SECTION)
+        for category in categories:
+            self._write_category_page(
+                category,
+                counts.get(category, {}),
+                ebuilds.get(category, []),
+                page_dir,
+            )
+
+        package_checks = False
+        with open(
+            self.reports_dir / "package-checks.html", "w", buffering=REPORT_BUFFER
+        ) as out:
+            out.write(self._html_head("Package Checks - COSMIC Overlay QA Report"))
+            out.write("""
+        <h1>Package Checks</h1>
+        <p><a href='index.html'>← Back to report</a></p>
+        <div class='output-section'><div class='output-content'>""")
+            package_checks = self._escape_first_output(
+                out, ["package-checks.txt", "category-checks.txt"]
+            )
+            if not package_checks:
+                out.write("No package checks output available")
+            out.write("</div></div>" + REPORT_PAGE_FOOTER)
+
+        with open(output_path, "w", buffering=REPORT_BUFFER) as out:
+            out.write(self._html_head("COSMIC Overlay QA Report"))
+            out.write(
+                f"""
         <h1>🚀 COSMIC Overlay QA Report</h1>
         <div class='meta'>
             <strong>Generated:</strong> {report_date}<br>
             <strong>Commit:</strong> <code>{commit_sha_short}</code><br>
             <strong>Workflow:</strong> {workflow}<br>
-            <strong>QA Tool:</strong> {qa_tool}
+            <strong>QA Tool:</strong> {results.qa_tool}<br>
+            <strong>Scope:</strong> {self._escape_html(self.scan_scope)}
         </div>
         <div class='status {status_class}'>
             {status_icon} {status_text}
         </div>
         <div class='stats-row' style='margin: 1em 0; font-size: 1.1em;'>
-            <strong>Total Issues:</strong> {total_issues} &nbsp;|
+            <strong>Total Issues:</strong> {results.total_issues} &nbsp;|
             <strong>Errors:</strong> {errors} &nbsp;|
             <strong>Warnings:</strong> {warnings}
-            {f'| <strong>Info:</strong> {info} | <strong>Style:</strong> {style}' if style > 0 else ''}
-            <br><span style='font-size:0.9em;'>[{ignored_total} ignored, {tolerated_total} tolerated]</span>
+            {f"| <strong>Info:</strong> {results.counts['info']} | <strong>Style:</strong> {results.counts['style']}" if results.counts['style'] > 0 else ''}
+            <br><span style='font-size:0.9em;'>[{results.ignored_total} ignored, {results.tolerated_total} tolerated]</span>
         </div>
-        <h2>📋 Detailed Results</h2>"""
-        if package_issues:
-            html_content += """
-        <h3>Package Issues</h3>
-        <table class='issues-table'>
-            <thead><tr><th>Package</th><th>Level</th><th>Message</th><th>Tool</th></tr></thead><tbody>"""
-            for issue in package_issues:
-                level_class = f"level-{issue['level']}"
-                html_content += f"<tr><td><span class='package-name'>{self._escape_html(issue['package'])}</span></td><td><span class='{level_class}'>{issue['level'].upper()}</span></td><td class='message'>{self._escape_html(issue['message'])}</td><td>{issue['tool']}</td></tr>"
-            html_content += """
-            </tbody></table>"""
-        html_content += """
-        <h3>QA Scan Output</h3>
-        <div class='output-section'>"""
-        scan_json_path = self.reports_dir / "pkgcheck-scan.json"
-        rows: List[Tuple[str, str, str, str, str, str]] = []
-        if scan_json_path.exists():
-            with open(scan_json_path) as f:
-                scan_lines = f.readlines()
-            for line in scan_lines:
-                try:
-                    entry = json.loads(line)
-                except Exception:
-                    continue
-                if not isinstance(entry, dict):
-                    continue
-                for cat, pkgs in entry.items():
-                    if not isinstance(pkgs, dict):
-                        continue
-                    for pkg, vers in pkgs.items():
-                        if not isinstance(vers, dict):
-                            continue
-                        for ver, issues in vers.items():
-                            if not isinstance(issues, dict):
-                                continue
-                            for level, checks in issues.items():
-                                if not isinstance(checks, dict):
-                                    continue
-                                for check, msg in checks.items():
-                                    rows.append((cat, pkg, ver, level[1:], check, msg))
-        # Filter rows using .qaignore rules
-        ignore_path = Path.cwd() / ".qaignore"
-        rules = self.parse_qaignore(ignore_path)
-        filtered_rows: List[Tuple[str, str, str, str, str, str]] = []
-        for cat, pkg, ver, level, check, msg in rows:
-            atom = f"{cat}/{pkg}"
-            if not self.should_ignore(atom, ver, check, rules):
-                filtered_rows.append((cat, pkg, ver, level, check, msg))
-        if filtered_rows:
-            html_content += "<table class='issues-table'><thead><tr><th>Category</th><th>Package</th><th>Version</th><th>Level</th><th>Check</th><th>Message</th></tr></thead><tbody>"
-            for cat, pkg, ver, level, check, msg in filtered_rows:
-                html_content += f"<tr><td>{self._escape_html(cat)}</td><td>{self._escape_html(pkg)}</td><td>{self._escape_html(ver)}</td><td class='level-{level}'>{level.capitalize()}</td><td>{self._escape_html(check)}</td><td class='message'>{self._escape_html(msg)}</td></tr>"
-            html_content += "</tbody></table>"
-        else:
-            html_content += (
-                "<div class='output-content'>No detailed QA scan output available</div>"
+        <h2>📋 Results by Category</h2>
+        <table class='issues-table'><thead><tr><th>Category</th><th>Packages</th>{"".join(f"<th>{level.capitalize()}</th>" for level in LEVELS)}</tr></thead><tbody>"""
             )
-        html_content += """
-        </div>"""
-        html_content += """
-        <h3>Package Checks</h3>
-        <div class='output-section'><div class='output-content'>"""
-        package_output = ""
-        for filename in ["package-checks.txt", "category-checks.txt"]:
-            filepath = self.reports_dir / filename
-            if filepath.exists():
-                try:
-                    with open(filepath) as f:
-                        package_output = f.read()
-                    break
-                except IOError:
-                    continue
-        if not package_output:
-            package_output = "No package checks output available"
-        html_content += self._escape_html(package_output)
-        html_content += """
-            </div></div>
-        <h2>📊 Package Statistics</h2><ul>"""
-        for category in [
-            "cosmic-base",
-            "acct-group",
-            "acct-user",
-            "dev-util",
-            "virtual",
-            "x11-themes",
-        ]:
-            category_path = self.overlay_root / category
-            if category_path.is_dir():
-                pkg_count = len([d for d in category_path.iterdir() if d.is_dir()])
-                html_content += (
-                    f"<li><strong>{category}/:</strong> {pkg_count} packages</li>\n"
+            for category in categories:
+                name = (
+                    "(repository)"
+                    if category == REPO_SECTION
+                    else f"{self._escape_html(category)}/"
                 )
-        html_content += """
-        </ul>
-        <h2>📄 Files Checked</h2><ul class='file-list'>"""
-        ebuilds = sorted(self.overlay_root.glob("**/*.ebuild"))
-        for ebuild in ebuilds:
-            rel_path = ebuild.relative_to(self.overlay_root)
-            html_content += f"<li>{rel_path}</li>\n"
-        html_content += f"""
-        </ul>
-        <footer>
-            Generated by COSMIC Overlay QA Pipeline • 
-            <a href='https://github.com/fsvm88/cosmic-overlay'>View Repository</a>
-        </footer>
-    </div>
-</body>
-</html>"""
-        with open(output_path, "w") as f:
-            f.write(html_content)
+                level_counts = counts.get(category, {})
+                cells = "".join(
+                    (
+                        f"<td class='level-{level}'>{level_counts[level]}</td>"
+                        if level_counts.get(level)
+                        else "<td>0</td>"
+                    )
+                    for level in LEVELS
+                )
+                out.write(
+                    f"<tr><td><a class='package-name' href='categories/{category}.html'>"
+                    f"{name}</a></td>"
+                    f"<td>{len(inventory.packages.get(category, []))}</td>{cells}</tr>\n"
+                )
+            out.write(
+                """</tbody></table>
+        <h2>⏱️ Phase Timings</h2>
+        <table class='issues-table'><thead><tr><th>Phase</th><th>Wall (s)</th><th>CPU (s)</th><th>Child CPU (s)</th><th>Child Peak RSS (MiB)</th></tr></thead><tbody>"""
+            )
+            for row in self._timing_rows():
+                out.write(
+                    "<tr>"
+                    + "".join(f"<td>{self._escape_html(cell)}</td>" for cell in row)
+                    + "</tr>\n"
+                )
+            out.write(
+                f"""</tbody></table>
+        <h3>Package Checks</h3>
+        <p>{"<a href='package-checks.html'>View package check output</a>" if package_checks else "No package checks output available"}</p>"""
+                + REPORT_PAGE_FOOTER
+            )
         self._log(f"HTML report generated: {output_path}")
 
     def generate_reports_readme(self) -> None:
@@ -594,6 +1471,11 @@ This directory contains automatically generated QA reports for the COSMIC overla
 ## Files
 
 - `index.html` - Main HTML report (open in browser)
+- `categories/` - Per-category HTML pages and their issue data scripts
+- `package-checks.html` - Package check output
+- `distfiles-check.txt` - Manifest DIST entries checked against `--distdir`
+- `timings.json` - Wall clock, CPU and child process usage per QA phase
+- `baseline.md` - Issues new and fixed since `--baseline` (baseline mode only)
 - `report.md` - Detailed Markdown report
 
 ## Generated
@@ -615,338 +1497,1170 @@ This directory contains automatically generated QA reports for the COSMIC overla
         if missing_files:
             self._error(f"Missing essential overlay files: {', '.join(missing_files)}")
             return False
+        inventory = self.get_inventory()
         # Check for ebuilds
-        ebuilds: List[Path] = list(self.overlay_root.glob("**/*.ebuild"))
-        if not ebuilds:
+        if not inventory.ebuilds:
             self._error("No ebuilds found in overlay")
             return False
-        self._success(f"Found {len(ebuilds)} ebuilds in overlay")
+        self._success(f"Found {len(inventory.ebuilds)} ebuilds in overlay")
         # Check for categories
-        categories: List[str] = [
-            d.name
-            for d in self.overlay_root.iterdir()
-            if d.is_dir()
-            and not d.name.startswith(".")
-            and d.name not in ["metadata", "profiles", "scripts", "files"]
-        ]
+        categories: List[str] = inventory.categories
         if not categories:
             self._error("No package categories found")
             return False
         self._success(f"Found categories: {', '.join(sorted(categories))}")
         return True
 
-    def run_pkgcheck_scan(self) -> Tuple[bool, int, int]:
-        """Run pkgcheck scan and return results."""
+    def run_pkgcheck_scan(
+        self, targets: Optional[List[str]] = None
+    ) -> Tuple[bool, int, int]:
+        """Run pkgcheck scan on targets (None for the whole overlay)."""
+        return asyncio.run(self.run_pkgcheck_scan_async(targets))
+
+    async def run_pkgcheck_scan_async(
+        self, targets: Optional[List[str]] = None
+    ) -> Tuple[bool, int, int]:
+        """Asynchronous variant of run_pkgcheck_scan, honouring pkgcheck_timeout."""
         self._log("Running pkgcheck scan...")
         if not self.has_pkgcheck:
             self._error("pkgcheck not available")
             return False, 0, 0
+        if targets is not None and not targets and self.watch_results is None:
+            self._success("No packages to scan")
+            for filename in ["pkgcheck-scan.json", "pkgcheck-scan.txt"]:
+                (self.reports_dir / filename).write_text("")
+            self._qa_results = None
+            return True, 0, 0
         cmd = [
-            "pkgcheck",
+            self.pkgcheck_bin,
             "scan",
             "--config",
             str(self.config) if self.config else "",
             "--reporter",
             "JsonReporter",
-            str(self.overlay_root),
         ]
-        json_output_file = self.reports_dir / "pkgcheck-scan.json"
-        try:
-            self._log(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, cwd=self.overlay_root
+        keys: Dict[str, str] = {}
+        replay: Optional[Dict[str, List[str]]] = None
+        scanned: Optional[List[str]] = targets
+        full_run = targets is None
+        if self.watch_results is not None and targets is not None:
+            # --watch: packages that did not change keep their last results
+            replay = {
+                target: lines
+                for target, lines in self.watch_results.items()
+                if target not in targets
+            }
+        elif self.cache is not None:
+            # Only cache misses get scanned, hits are replayed from the cache
+            all_targets = (
+                targets if targets is not None else self.get_inventory().package_targets
             )
-            with open(json_output_file, "w") as f:
-                f.write(result.stdout)
-            # Also run with text output for readability
-            cmd_txt = cmd[:-1] + ["--reporter", "StrReporter", str(self.overlay_root)]
-            result_txt = subprocess.run(
-                cmd_txt, capture_output=True, text=True, cwd=self.overlay_root
+            keys = {target: self._package_fingerprint(target) for target in all_targets}
+            if full_run:
+                # Results of the repo-scope pass are cached as one entry
+                keys[REPO_SECTION] = self._repo_fingerprint(keys)
+            replay = {}
+            for target, key in keys.items():
+                cached = self.cache.get(key)
+                if cached is not None:
+                    replay[target] = cached
+            targets = [target for target in all_targets if target not in replay]
+            self._log(
+                f"Result cache: {len(replay)} hits, {len(keys) - len(replay)} misses"
             )
-            txt_output_file = self.reports_dir / "pkgcheck-scan.txt"
-            with open(txt_output_file, "w") as f:
-                f.write(result_txt.stdout)
-            # Save raw pkgcheck output for debugging config usage
-            debug_output_file = self.reports_dir / "pkgcheck-debug.txt"
-            with open(debug_output_file, "w") as f:
-                f.write(result.stdout)
-            # Parse results
-            errors = warnings = 0
-            try:
-                if result.stdout.strip():
-                    data = json.loads(result.stdout)
-                    for item in data:
-                        level = item.get("level", "").lower()
-                        if level == "error":
-                            errors += 1
-                        elif level == "warning":
-                            warnings += 1
-            except json.JSONDecodeError:
-                error_count = result_txt.stdout.count("ERROR")
-                warning_count = result_txt.stdout.count("WARNING")
-                errors = max(errors, error_count)
-                warnings = max(warnings, warning_count)
-            success = result.returncode == 0
-            if success:
-                self._success(
-                    f"pkgcheck completed: {errors} errors, {warnings} warnings"
-                )
-            else:
-                self._log(
-                    f"pkgcheck completed with issues: {errors} errors, {warnings} warnings"
-                )
-            return success, errors, warnings
-        except subprocess.CalledProcessError as e:
-            self._error(f"pkgcheck failed: {e}")
+        repo_cmd: Optional[List[str]] = None
+        if full_run and not (replay is not None and REPO_SECTION in replay):
+            repo_cmd = cmd + [REPO_SCOPE_ARG, str(self.overlay_root)]
+        shards: Optional[List[str]] = None
+        if targets == [] or (
+            self.jobs > 1 and self.pkgcheck_api is None and not self.matrix
+        ):
+            shards = (
+                targets if targets is not None else self.get_inventory().package_targets
+            )
+        else:
+            cmd += targets or [str(self.overlay_root)]
+            if self.pkgcheck_api is not None and self.jobs > 1:
+                # One in-process scan, parallelised by pkgcheck itself
+                cmd += ["--jobs", str(self.jobs)]
+        if shards is None and self.cache is None:
+            # Only package targets miss the repository and category checks
+            repo_cmd = None
+        try:
+            outcome = await asyncio.wait_for(
+                self._stream_pkgcheck(cmd, shards, replay, repo_cmd),
+                self.pkgcheck_timeout,
+            )
+            if self.cache is not None and replay is not None and not self.aborted:
+                self._store_cached_results(keys, replay)
+            if self.watch_results is not None and not self.aborted:
+                self._remember_results(scanned, replay)
+            return outcome
+        except asyncio.TimeoutError:
+            self._error(f"pkgcheck timed out after {self.pkgcheck_timeout}s")
             return False, 0, 0
         except Exception as e:
             self._error(f"Unexpected error running pkgcheck: {e}")
             return False, 0, 0
 
-    def run_pkgdev_manifest(self) -> bool:
+    def _store_cached_results(
+        self, keys: Dict[str, str], replay: Dict[str, List[str]]
+    ) -> None:
+        """Cache the freshly scanned packages of a completed scan, then evict."""
+        stored = 0
+        for target, key in keys.items():
+            if target in replay:
+                continue
+            if target == REPO_SECTION:
+                code = self._last_exit_codes.get(REPO_SCOPE)
+                # Repository and category results, keyed without a "/"
+                lines = [
+                    line
+                    for capture_key, captured in self._last_capture.items()
+                    if "/" not in capture_key
+                    for line in captured
+                ]
+            else:
+                code = self._last_exit_codes.get(
+                    target, self._last_exit_codes.get("overlay")
+                )
+                lines = self._last_capture.get(target, [])
+            if code in PKGCHECK_OK_EXIT_CODES:
+                self.cache.put(key, lines)
+                stored += 1
+        evicted = self.cache.evict()
+        self._log(f"Result cache: {stored} stored, {evicted} evicted")
+
+    def _remember_results(
+        self, scanned: Optional[List[str]], replay: Optional[Dict[str, List[str]]]
+    ) -> None:
+        """Keep a scan's result lines in memory for --watch rescans."""
+        results: Dict[str, List[str]] = dict(replay or {})
+        for target in scanned or []:
+            results[target] = []
+        results.update(self._last_capture)
+        self.watch_results = results
+
+    async def _stream_pkgcheck(
+        self,
+        cmd: List[str],
+        shards: Optional[List[str]] = None,
+        replay: Optional[Dict[str, List[str]]] = None,
+        repo_cmd: Optional[List[str]] = None,
+    ) -> Tuple[bool, int, int]:
+        """Stream replayed, scanned and repo-scope results into the reports."""
+        json_output_file = self.reports_dir / "pkgcheck-scan.json"
+        txt_output_file = self.reports_dir / "pkgcheck-scan.txt"
+        # Results are parsed, filtered and written out as they arrive, so
+        # pkgcheck's output is never held in memory as a whole
+        with tempfile.TemporaryFile() as stderr_file, open(
+            json_output_file, "w"
+        ) as json_file, open(txt_output_file, "w") as txt_file:
+            sink = ScanSink(json_file, txt_file, QAResults("pkgcheck"))
+            for lines in (replay or {}).values():
+                for line in lines:
+                    if self.aborted:
+                        break
+                    self._ingest_pkgcheck_line(line, sink)
+            if replay is not None or self.watch_results is not None:
+                sink.capture = {}
+            if self.aborted:
+                # Fail-fast tripped on a replayed result, nothing is scanned
+                exit_codes: Dict[str, int] = {}
+            elif self.matrix and shards is None:
+                exit_codes = await self._run_pkgcheck_matrix(cmd, sink, stderr_file)
+            elif shards is None:
+                mode = "in-process" if self.pkgcheck_api is not None else "Running"
+                self._log(f"{mode}: {' '.join(cmd)}")
+                run = (
+                    self._run_pkgcheck_api
+                    if self.pkgcheck_api is not None
+                    else self._run_pkgcheck_process
+                )
+                if repo_cmd is None:
+                    exit_codes = {"overlay": await run(cmd, sink, stderr_file)}
+                else:
+                    codes = await asyncio.gather(
+                        run(cmd, sink, stderr_file), run(repo_cmd, sink, stderr_file)
+                    )
+                    exit_codes = {"overlay": codes[0], REPO_SCOPE: codes[1]}
+            else:
+                exit_codes = await self._run_pkgcheck_shards(
+                    cmd, shards, sink, stderr_file, repo_cmd
+                )
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+        self._qa_results = sink.results
+        self._last_exit_codes = exit_codes
+        self._last_capture = sink.capture or {}
+        errors, warnings = sink.errors, sink.warnings
+        failed = {target: code for target, code in exit_codes.items() if code != 0}
+        # Save the invocation details for debugging config usage
+        debug_output_file = self.reports_dir / "pkgcheck-debug.txt"
+        with open(debug_output_file, "w") as f:
+            f.write(f"Command: {' '.join(cmd)}\n")
+            f.write(f"Config: {self.config}\n")
+            if self.matrix and shards is None:
+                for entry, code in exit_codes.items():
+                    f.write(f"Exit code {code}: {entry}\n")
+            elif shards is None:
+                f.write(f"Exit code: {exit_codes.get('overlay')}\n")
+            else:
+                f.write(f"Shards: {len(shards)} packages, {self.jobs} jobs\n")
+                for target, code in sorted(failed.items()):
+                    if target != REPO_SCOPE:
+                        f.write(f"Exit code {code}: {target}\n")
+            if repo_cmd is not None:
+                f.write(f"Repo-scope pass: {' '.join(repo_cmd)}\n")
+                f.write(f"Exit code {exit_codes.get(REPO_SCOPE)}: {REPO_SCOPE}\n")
+            f.write(f"Result lines: {sink.lines}\n")
+            if self.aborted:
+                f.write("Aborted: fail-fast on first unsuppressed error\n")
+            if stderr:
+                f.write("\n=== STDERR ===\n")
+                f.write(stderr)
+        success = not failed and not self.aborted
+        if self.aborted:
+            self._log(f"pkgcheck stopped after {sink.lines} results")
+        elif success:
+            self._success(f"pkgcheck completed: {errors} errors, {warnings} warnings")
+        else:
+            self._log(
+                f"pkgcheck completed with issues: {errors} errors, {warnings} warnings"
+            )
+        return success, errors, warnings
+
+    async def _run_pkgcheck_process(
+        self, cmd: List[str], sink: ScanSink, stderr_file: Any
+    ) -> int:
+        """Run one pkgcheck process, feeding its results into sink."""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=stderr_file,
+            cwd=self.overlay_root,
+            limit=STREAM_LIMIT,
+        )
+        try:
+            while not self.aborted:
+                raw_line = await process.stdout.readline()
+                if not raw_line:
+                    break
+                self._ingest_pkgcheck_line(raw_line.decode(errors="replace"), sink)
+            if self.aborted:
+                process.kill()
+            return await process.wait()
+        finally:
+            # Reached on timeout and cancellation
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    async def _run_pkgcheck_matrix(
+        self, cmd: List[str], sink: ScanSink, stderr_file: Any
+    ) -> Dict[str, int]:
+        """Scan every matrix entry concurrently and merge identical results."""
+        assert self.matrix
+        captures: Dict[str, Dict[str, List[str]]] = {}
+        exit_codes: Dict[str, int] = {}
+        self._log(f"Scanning matrix of {len(self.matrix)}: {', '.join(self.matrix)}")
+
+        async def scan(entry: str) -> None:
+            arch, _, profile = entry.partition(":")
+            entry_cmd = cmd + ["--arches", arch]
+            if profile:
+                entry_cmd += ["--profiles", profile]
+            if self.jobs > 1:
+                entry_cmd += ["--jobs", str(self.jobs)]
+            self._log(f"Running: {' '.join(entry_cmd)}")
+            with open(os.devnull, "w") as devnull:
+                entry_sink = ScanSink(devnull, devnull, QAResults("pkgcheck"))
+                entry_sink.capture = {}
+                start = time.monotonic()
+                exit_codes[entry] = await self._run_pkgcheck_process(
+                    entry_cmd, entry_sink, stderr_file
+                )
+            captures[entry] = entry_sink.capture
+            self._log(
+                f"pkgcheck [{entry}] {entry_sink.lines} results "
+                f"({time.monotonic() - start:.1f}s)"
+            )
+
+        await asyncio.gather(*(scan(entry) for entry in self.matrix))
+        merged: Dict[str, List[str]] = {}
+        for entry in self.matrix:
+            for lines in captures.get(entry, {}).values():
+                for line in lines:
+                    merged.setdefault(line, []).append(entry)
+        # Fail-fast was applied as the entries' results arrived, everything
+        # gathered until an abort is still merged into the reports
+        fail_fast, self.fail_fast = self.fail_fast, False
+        try:
+            for line, entries in merged.items():
+                items = self._parse_pkgcheck_line(line)
+                for item in items:
+                    item["arch"] = ",".join(entries)
+                self._ingest_pkgcheck_items(line, items, sink)
+        finally:
+            self.fail_fast = fail_fast
+        return {
+            entry: exit_codes[entry] for entry in self.matrix if entry in exit_codes
+        }
+
+    async def _run_pkgcheck_api(
+        self, cmd: List[str], sink: ScanSink, stderr_file: Any
+    ) -> int:
+        """Run cmd's scan in-process on a daemon thread, feeding results into sink."""
+        # A timeout does not wait for the thread, which stops at its next
+        # result; only the loop writes to stderr_file, and not once stopped
+        assert self.pkgcheck_api is not None
+        api = self.pkgcheck_api
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Optional[Dict[str, Optional[str]]]]" = asyncio.Queue()
+        scan: "asyncio.Future[int]" = loop.create_future()
+        stop = threading.Event()
+
+        def post(callback: Any, *args: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(callback, *args)
+            except RuntimeError:
+                # The loop closed after a timeout; nobody is listening
+                stop.set()
+
+        def report(error: str) -> None:
+            # The caller closes stderr_file once the scan has stopped
+            if not stop.is_set():
+                stderr_file.write(error.encode())
+
+        def produce() -> None:
+            code = 0
+            try:
+                # cmd[2:] drops the executable and "scan" subcommand
+                for item in api.scan(cmd[2:], self.overlay_root):
+                    if stop.is_set():
+                        break
+                    post(queue.put_nowait, item)
+            except Exception:
+                post(report, traceback.format_exc())
+                code = 2
+            finally:
+                post(queue.put_nowait, None)
+                post(lambda: scan.done() or scan.set_result(code))
+
+        threading.Thread(target=produce, name="pkgcheck-api", daemon=True).start()
+        try:
+            while not self.aborted:
+                item = await queue.get()
+                if item is None:
+                    break
+                line = self._pkgcheck_json_line(item)
+                self._ingest_pkgcheck_items(line, [item], sink)
+        finally:
+            # Reached on fail-fast, timeout and cancellation
+            stop.set()
+        return await scan
+
+    def _pkgcheck_json_line(self, item: Dict[str, Optional[str]]) -> str:
+        """Render a result record as a JsonReporter line."""
+        node: Dict[str, Any] = {f"_{item['level']}": {item["check"]: item["message"]}}
+        for key in ("version", "package", "category"):
+            if item[key]:
+                node = {item[key]: node}
+        return json.dumps(node) + "\n"
+
+    def _ingest_pkgcheck_line(self, line: str, sink: ScanSink) -> None:
+        self._ingest_pkgcheck_items(line, self._parse_pkgcheck_line(line), sink)
+
+    def _ingest_pkgcheck_items(
+        self, line: str, items: List[Dict[str, Optional[str]]], sink: ScanSink
+    ) -> None:
+        """Write one JsonReporter line and record the results it holds."""
+        sink.json_file.write(line)
+        sink.lines += 1
+        # The JSON results are the single source of truth, the text report is
+        # rendered from them
+        if (sink.capture is not None or sink.package_results is not None) and items:
+            # Results without a package are kept under their category, or
+            # REPO_SECTION, so --watch can replay them too
+            item = items[0]
+            if item["package"]:
+                key = f"{item['category']}/{item['package']}"
+            else:
+                key = item["category"] or REPO_SECTION
+            if sink.capture is not None:
+                sink.capture.setdefault(key, []).append(line)
+            if sink.package_results is not None:
+                sink.package_results[key] = sink.package_results.get(key, 0) + 1
+        for item in items:
+            sink.txt_file.write(self._format_pkgcheck_result(item) + "\n")
+            if item["level"] == "error":
+                sink.errors += 1
+            elif item["level"] == "warning":
+                sink.warnings += 1
+            issue = self._record_result(sink.results, item)
+            if (
+                self.fail_fast
+                and issue is not None
+                and issue.level == "error"
+                and not issue.tolerated
+            ):
+                self.aborted = True
+                self._error(f"Fail-fast: {issue.atom}: {issue.check}: {issue.message}")
+                return
+        if time.monotonic() - sink.last_progress >= PROGRESS_INTERVAL:
+            sink.last_progress = time.monotonic()
+            self._log(
+                f"pkgcheck: {sink.lines} results so far "
+                f"({sink.errors} errors, {sink.warnings} warnings)"
+            )
+
+    async def _run_pkgcheck_shards(
+        self,
+        cmd: List[str],
+        shards: List[str],
+        sink: ScanSink,
+        stderr_file: Any,
+        repo_cmd: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """Scan shards as up to self.jobs concurrent multi-package pkgcheck runs."""
+        durations = self._load_shard_durations()
+        batches = self._batch_shards(shards, durations)
+        exit_codes: Dict[str, int] = {}
+        self._log(f"Scanning {len(shards)} packages in {len(batches)} shards")
+        if sink.package_results is None:
+            sink.package_results = {}
+        results = sink.package_results
+
+        async def scan(batch: List[str]) -> None:
+            start = time.monotonic()
+            code = await self._run_pkgcheck_process(cmd + batch, sink, stderr_file)
+            elapsed = time.monotonic() - start
+            # pkgcheck does not time packages, so the batch's wall time is
+            # split by the results each package produced, plus one share
+            # for the fixed cost of scanning a package at all
+            weights = [1 + results.get(target, 0) for target in batch]
+            total = sum(weights)
+            for target, weight in zip(batch, weights):
+                exit_codes[target] = code
+                if not self.aborted:
+                    durations[target] = elapsed * weight / total
+            self._log(f"pkgcheck shard of {len(batch)} packages ({elapsed:.1f}s)")
+
+        async def scan_repo(repo_cmd: List[str]) -> None:
+            exit_codes[REPO_SCOPE] = await self._run_pkgcheck_process(
+                repo_cmd, sink, stderr_file
+            )
+
+        runs = [scan(batch) for batch in batches]
+        if repo_cmd is not None:
+            runs.append(scan_repo(repo_cmd))
+        await asyncio.gather(*runs)
+        self._save_shard_durations(durations)
+        return exit_codes
+
+    def _batch_shards(
+        self, shards: List[str], durations: Dict[str, float]
+    ) -> List[List[str]]:
+        """Split shards into self.jobs batches of similar estimated duration."""
+        known = [durations[target] for target in shards if target in durations]
+        default = sum(known) / len(known) if known else 1.0
+        batches: List[List[str]] = [[] for _ in range(min(self.jobs, len(shards)))]
+        loads = [0.0] * len(batches)
+        # Longest first, each onto the least loaded batch
+        for target in sorted(
+            shards, key=lambda target: durations.get(target, default), reverse=True
+        ):
+            index = loads.index(min(loads))
+            batches[index].append(target)
+            loads[index] += durations.get(target, default)
+        return [sorted(batch) for batch in batches]
+
+    def _load_shard_durations(self) -> Dict[str, float]:
+        try:
+            with open(self.reports_dir / "pkgcheck-durations.json") as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            target: float(seconds)
+            for target, seconds in data.items()
+            if isinstance(seconds, (int, float))
+        }
+
+    def _save_shard_durations(self, durations: Dict[str, float]) -> None:
+        with open(self.reports_dir / "pkgcheck-durations.json", "w") as f:
+            rounded = {
+                target: round(seconds, 3)
+                for target, seconds in sorted(durations.items())
+            }
+            json.dump(rounded, f, indent=1)
+
+    def _parse_pkgcheck_line(self, line: str) -> List[Dict[str, Optional[str]]]:
+        """Flatten one JsonReporter line into result records."""
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            return []
+        results: List[Dict[str, Optional[str]]] = []
+
+        def walk(node: Dict[str, Any], keys: List[str]) -> None:
+            for key, value in node.items():
+                if not isinstance(value, dict):
+                    continue
+                if key.startswith("_"):
+                    scope = (keys + [None, None, None])[:3]
+                    for check, msg in value.items():
+                        results.append(
+                            {
+                                "category": scope[0],
+                                "package": scope[1],
+                                "version": scope[2],
+                                "level": key[1:].lower(),
+                                "check": check,
+                                "message": str(msg),
+                            }
+                        )
+                elif len(keys) < 3:
+                    walk(value, keys + [key])
+
+        if isinstance(entry, dict):
+            walk(entry, [])
+        return results
+
+    def _format_pkgcheck_result(self, item: Dict[str, Optional[str]]) -> str:
+        """Render a result record like StrReporter, with level and check name."""
+        if item["version"]:
+            prefix = f"{item['category']}/{item['package']}-{item['version']}: "
+        elif item["package"]:
+            prefix = f"{item['category']}/{item['package']}: "
+        elif item["category"]:
+            prefix = f"{item['category']}: "
+        else:
+            prefix = ""
+        level = (item["level"] or "").upper()
+        arch = f" [{item['arch']}]" if item.get("arch") else ""
+        return f"{prefix}{level}: {item['check']}: {item['message']}{arch}"
+
+    def run_pkgdev_manifest(self, targets: Optional[List[str]] = None) -> bool:
         """Run pkgdev manifest to check manifest integrity."""
+        return asyncio.run(self.run_pkgdev_manifest_async(targets))
+
+    async def run_pkgdev_manifest_async(
+        self, targets: Optional[List[str]] = None
+    ) -> bool:
+        """Asynchronous variant of run_pkgdev_manifest, honouring pkgdev_timeout."""
         self._log("Checking manifest integrity...")
         if not self.has_pkgdev:
             self._log("pkgdev not available - skipping manifest check")
             return True
+        if targets is not None and not targets:
+            self._log("No packages changed - skipping manifest check")
+            return True
         try:
-            cmd = ["pkgdev", "manifest", str(self.overlay_root)]
+            cmd = [self.pkgdev_bin, "manifest"] + (targets or [str(self.overlay_root)])
             self._log(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, cwd=self.overlay_root
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.overlay_root,
             )
+            try:
+                stdout_raw, stderr_raw = await asyncio.wait_for(
+                    process.communicate(), self.pkgdev_timeout
+                )
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+            stdout = stdout_raw.decode(errors="replace")
+            stderr = stderr_raw.decode(errors="replace")
             manifest_output_file = self.reports_dir / "manifest-check.txt"
             with open(manifest_output_file, "w") as f:
-                if result.stdout:
-                    f.write(result.stdout)
-                if result.stderr:
+                if stdout:
+                    f.write(stdout)
+                if stderr:
                     f.write("\n=== STDERR ===\n")
-                    f.write(result.stderr)
-                if not result.stdout and not result.stderr:
+                    f.write(stderr)
+                if not stdout and not stderr:
                     f.write("No manifest issues found\n")
-            if result.returncode == 0:
+            if process.returncode == 0:
                 self._success("Manifest check passed")
                 return True
             else:
                 self._log(
-                    f"Manifest check found issues (exit code: {result.returncode})"
+                    f"Manifest check found issues (exit code: {process.returncode})"
                 )
                 return False
-        except subprocess.CalledProcessError as e:
-            self._error(f"pkgdev manifest failed: {e}")
+        except asyncio.TimeoutError:
+            self._error(f"pkgdev manifest timed out after {self.pkgdev_timeout}s")
             return False
         except Exception as e:
             self._error(f"Unexpected error running pkgdev manifest: {e}")
             return False
 
-    def get_qa_results(
-        self,
-    ) -> Tuple[int, int, int, int, int, str, int, int, int, int, int]:
-        """Parse QA results and return counts, including ignored counts."""
-        total_issues: int = 0
-        errors: int = 0
-        warnings: int = 0
-        info: int = 0
-        style: int = 0
-        ignored_errors: int = 0
-        ignored_warnings: int = 0
-        ignored_info: int = 0
-        ignored_style: int = 0
-        tolerated_errors: int = 0
-        tolerated_warnings: int = 0
-        tolerated_info: int = 0
-        tolerated_style: int = 0
-        qa_tool: str = "basic"
-        pkgcheck_json: Path = self.reports_dir / "pkgcheck-scan.json"
-        all_results: List[Dict[str, Any]] = []
-        if pkgcheck_json.exists():
-            with open(pkgcheck_json) as f:
+    def parse_manifest(self, manifest: Path) -> Dict[str, Tuple[int, Dict[str, str]]]:
+        """Return a Manifest's DIST entries as name -> (size, {hash: digest})."""
+        entries: Dict[str, Tuple[int, Dict[str, str]]] = {}
+        try:
+            with open(manifest) as f:
                 for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry: Dict[str, Any] = eval(line, {}, {})
-                    except Exception:
+                    parts = line.split()
+                    if len(parts) < 3 or parts[0] != "DIST" or not parts[2].isdigit():
                         continue
-                    for cat, pkgs in entry.items():
-                        if not isinstance(pkgs, dict):
-                            continue
-                        for pkg, vers in pkgs.items():
-                            if not isinstance(vers, dict):
-                                continue
-                            for ver, levels in vers.items():
-                                if not isinstance(levels, dict):
-                                    continue
-                                for level_key, checks in levels.items():
-                                    level: str = level_key.lstrip("_")
-                                    if not isinstance(checks, dict):
-                                        continue
-                                    for check, msg in checks.items():
-                                        all_results.append(
-                                            {
-                                                "atom": f"{cat}/{pkg}",
-                                                "version": ver,
-                                                "check": check,
-                                                "level": level,
-                                                "message": msg,
-                                            }
-                                        )
-        ignore_path: Path = Path.cwd() / ".qaignore"
-        tolerate_path: Path = Path.cwd() / ".qatolerate"
-        ignore_rules: List[Dict[str, Optional[str]]] = self.parse_qaignore(ignore_path)
-        tolerate_rules: List[Dict[str, Optional[str]]] = self.parse_qatolerate(
-            tolerate_path
+                    hashes = dict(zip(parts[3::2], (d.lower() for d in parts[4::2])))
+                    entries[parts[1]] = (int(parts[2]), hashes)
+        except IOError:
+            pass
+        return entries
+
+    def _load_digest_cache(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.reports_dir / ".cache" / "distfile-digests.json") as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_digest_cache(self, cache: Dict[str, Dict[str, Any]]) -> None:
+        path = self.reports_dir / ".cache" / "distfile-digests.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+
+    def _hash_distfiles(
+        self, pending: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Hash each path with its algorithms, on self.jobs processes."""
+        digests: Dict[str, Dict[str, str]] = {}
+        workers = min(self.jobs, len(pending))
+        if workers <= 1:
+            for path, algorithms in pending.items():
+                try:
+                    digests[path] = hash_distfile(path, algorithms)
+                except (IOError, ValueError) as e:
+                    self._error(f"Could not hash {path}: {e}")
+            return digests
+        with ProcessPoolExecutor(workers) as pool:
+            # Largest first, so one big distfile does not finish last alone
+            futures = {
+                path: pool.submit(hash_distfile, path, algorithms)
+                for path, algorithms in sorted(
+                    pending.items(),
+                    key=lambda item: os.path.getsize(item[0]),
+                    reverse=True,
+                )
+            }
+            for path, future in futures.items():
+                try:
+                    digests[path] = future.result()
+                except (IOError, ValueError) as e:
+                    self._error(f"Could not hash {path}: {e}")
+        return digests
+
+    def _distfile_digests(
+        self, wanted: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, str]]:
+        """Return path -> {hashlib name: digest}, reusing cached digests."""
+        cache = self._load_digest_cache()
+        pending: Dict[str, List[str]] = {}
+        cached = 0
+        for path, algorithms in wanted.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if not algorithms:
+                continue
+            entry = cache.get(path)
+            if (
+                entry
+                and entry.get("size") == stat.st_size
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and set(algorithms) <= set(entry.get("digests", {}))
+            ):
+                cached += 1
+            else:
+                pending[path] = algorithms
+        self._log(
+            f"Distfile digests: {cached} cached, "
+            f"hashing {len(pending)} with {self.jobs} jobs"
+        )
+        for path, digests in self._hash_distfiles(pending).items():
+            stat = os.stat(path)
+            cache[path] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "digests": digests,
+            }
+        self._save_digest_cache(
+            {path: entry for path, entry in cache.items() if os.path.exists(path)}
         )
-        for result in all_results:
-            atom, ver, check, level = (
-                result["atom"],
-                result["version"],
-                result["check"],
-                result["level"].lower(),
+        return {
+            path: cache[path]["digests"]
+            for path in wanted
+            if path in cache and os.path.exists(path)
+        }
+
+    def verify_distfiles(
+        self, results: QAResults, targets: Optional[List[str]] = None
+    ) -> bool:
+        """Check Manifest DIST sizes and digests against the files in distdir."""
+        assert self.distdir is not None
+        self._log(f"Verifying Manifest distfiles against {self.distdir}...")
+        if targets is None:
+            manifests = self.get_inventory().manifests
+        else:
+            manifests = [
+                self.overlay_root / target / "Manifest"
+                for target in targets
+                if (self.overlay_root / target / "Manifest").is_file()
+            ]
+        # distfile name -> (category, package, size, hashes) of each listing
+        listed: Dict[str, List[Tuple[str, str, int, Dict[str, str]]]] = {}
+        for manifest in manifests:
+            category, package = manifest.parent.parent.name, manifest.parent.name
+            for name, (size, hashes) in self.parse_manifest(manifest).items():
+                listed.setdefault(name, []).append((category, package, size, hashes))
+
+        stats: Dict[str, os.stat_result] = {}
+        wanted: Dict[str, List[str]] = {}
+        for name, entries in listed.items():
+            path = str(self.distdir / name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            stats[name] = stat
+            # Entries with the wrong size fail without hashing
+            wanted[path] = sorted(
+                {
+                    MANIFEST_HASHES[hash_name]
+                    for _, _, size, hashes in entries
+                    if size == stat.st_size
+                    for hash_name in hashes
+                    if hash_name in MANIFEST_HASHES
+                }
             )
-            ignored: bool = self.should_ignore(atom, ver, check, ignore_rules)
-            tolerated: bool = self.should_tolerate(atom, ver, check, tolerate_rules)
-            if level == "error":
-                if ignored:
-                    ignored_errors += 1
-                elif tolerated:
-                    tolerated_errors += 1
-                else:
-                    errors += 1
-            elif level == "warning":
-                if ignored:
-                    ignored_warnings += 1
-                elif tolerated:
-                    tolerated_warnings += 1
-                else:
-                    warnings += 1
-            elif level == "info":
-                if ignored:
-                    ignored_info += 1
-                elif tolerated:
-                    tolerated_info += 1
-                else:
-                    info += 1
-            elif level == "style":
-                if ignored:
-                    ignored_style += 1
-                elif tolerated:
-                    tolerated_style += 1
-                else:
-                    style += 1
-        total_issues = errors + warnings + info + style
-        ignored_total = ignored_errors + ignored_warnings + ignored_info + ignored_style
-        tolerated_total = (
-            tolerated_errors + tolerated_warnings + tolerated_info + tolerated_style
+        self._log(f"Distfiles: {len(listed)} listed, {len(stats)} present")
+        distfile_digests = self._distfile_digests(wanted)
+
+        verified = mismatched = missing = 0
+        with open(self.reports_dir / "distfiles-check.txt", "w") as f:
+            for name in sorted(listed):
+                stat = stats.get(name)
+                if stat is None:
+                    missing += 1
+                    f.write(f"MISSING {name}\n")
+                    continue
+                digests = distfile_digests.get(str(self.distdir / name), {})
+                for category, package, size, hashes in listed[name]:
+                    if size != stat.st_size:
+                        check = "DistfileSizeMismatch"
+                        message = f"{name}: {stat.st_size} bytes, Manifest lists {size}"
+                    else:
+                        bad = [
+                            hash_name
+                            for hash_name, expected in sorted(hashes.items())
+                            if hash_name in MANIFEST_HASHES
+                            and digests.get(MANIFEST_HASHES[hash_name]) != expected
+                        ]
+                        if not bad:
+                            verified += 1
+                            f.write(f"OK {category}/{package} {name}\n")
+                            continue
+                        check = "DistfileDigestMismatch"
+                        message = f"{name}: {', '.join(bad)} digest does not match"
+                    mismatched += 1
+                    f.write(f"FAILED {category}/{package} {message}\n")
+                    self._record_result(
+                        results,
+                        {
+                            "category": category,
+                            "package": package,
+                            "version": None,
+                            "level": "error",
+                            "check": check,
+                            "message": message,
+                        },
+                    )
+        if mismatched:
+            self._error(
+                f"Distfiles: {mismatched} mismatched, {verified} verified, "
+                f"{missing} missing"
+            )
+            return False
+        self._success(f"Distfiles: {verified} verified, {missing} missing")
+        return True
+
+    def regenerate(self) -> bool:
+        """Regenerate stale metadata cache entries and every package Manifest."""
+        return asyncio.run(ManifestRegenerator(self).run())
+
+    async def run_qa_tools(
+        self, targets: Optional[List[str]] = None
+    ) -> Tuple[bool, int, int]:
+        """Run pkgcheck scan and pkgdev manifest concurrently."""
+        timed = self.timings.timed
+        scan = asyncio.ensure_future(
+            timed("run_pkgcheck_scan", self.run_pkgcheck_scan_async(targets))
         )
-        # Only errors/warnings not ignored/tolerated cause failure
-        return (
-            total_issues,
-            errors,
-            warnings,
-            info,
-            style,
-            qa_tool,
-            ignored_errors,
-            ignored_warnings,
-            ignored_info,
-            ignored_style,
-            ignored_total,
-            tolerated_errors,
-            tolerated_warnings,
-            tolerated_info,
-            tolerated_style,
-            tolerated_total,
+        manifest = asyncio.ensure_future(
+            timed("run_pkgdev_manifest", self.run_pkgdev_manifest_async(targets))
         )
+        try:
+            success, errors, warnings = await scan
+            if self.aborted:
+                manifest.cancel()
+                await asyncio.gather(manifest, return_exceptions=True)
+                return False, errors, warnings
+            manifest_success = await manifest
+        finally:
+            for task in (scan, manifest):
+                task.cancel()
+        return success and manifest_success, errors, warnings
+
+    def _record_result(
+        self, results: QAResults, item: Dict[str, Optional[str]]
+    ) -> Optional[QAIssue]:
+        """Filter one parsed result into results; None if ignored or unknown."""
+        level = item["level"] or ""
+        if level not in results.counts:
+            return None
+        ignore_rules, tolerate_rules = self._get_rules()
+        category = item["category"] or ""
+        atom = f"{category}/{item['package']}" if item["package"] else category
+        ver, check = item["version"], item["check"] or ""
+        if ignore_rules.matches(atom, ver, check):
+            results.ignored[level] += 1
+            return None
+        tolerated = tolerate_rules.matches(atom, ver, check)
+        if tolerated:
+            results.tolerated[level] += 1
+        else:
+            results.counts[level] += 1
+        issue = QAIssue(
+            category,
+            item["package"] or "",
+            ver or "",
+            level,
+            check,
+            item["message"] or "",
+            tolerated,
+            item.get("arch") or "",
+        )
+        results.issues.append(issue)
+        return issue
+
+    def get_qa_results(self) -> QAResults:
+        """Parse QA results once per run and return the shared results model."""
+        if self._qa_results is not None:
+            return self._qa_results
+        results = QAResults()
+        pkgcheck_json: Path = self.reports_dir / "pkgcheck-scan.json"
+        if pkgcheck_json.exists():
+            results.qa_tool = "pkgcheck"
+            with open(pkgcheck_json) as f:
+                for line in f:
+                    for item in self._parse_pkgcheck_line(line):
+                        self._record_result(results, item)
+        # Only errors/warnings not ignored/tolerated cause failure
+        self._qa_results = results
+        return results
 
-    def run_full_qa_check(self) -> bool:
-        """Run complete QA check suite."""
+    def run_full_qa_check(self, targets: Optional[List[str]] = None) -> bool:
+        """Run complete QA check suite on targets, or since, or everything."""
         self._log("=== Starting COSMIC Overlay QA Check ===")
+        try:
+            return self._run_phases(targets)
+        finally:
+            self.timings.write(self.reports_dir / "timings.json")
+
+    def _run_phases(self, targets: Optional[List[str]] = None) -> bool:
+        phase = self.timings.phase
+        self.scan_scope = "full overlay"
 
         # Check requirements
-        has_modern_tools = self.check_requirements()
+        with phase("check_requirements"):
+            has_modern_tools = self.check_requirements()
 
         # Check overlay structure
-        if not self.check_overlay_structure():
+        with phase("check_overlay_structure"):
+            structure_ok = self.check_overlay_structure()
+        if not structure_ok:
             self._error("Overlay structure validation failed")
             return False
 
         overall_success = True
         total_errors = total_warnings = 0
 
+        # Narrow the scan down to touched packages in incremental mode
+        if targets is not None:
+            self.scan_scope = f"{len(targets)} packages changed"
+        elif self.since:
+            with phase("get_changed_targets"):
+                targets = self.get_changed_targets(self.since)
+            if targets is not None:
+                self.scan_scope = f"{len(targets)} packages changed since {self.since}"
+                self._log(f"Incremental mode: {self.scan_scope}")
+                for target in targets:
+                    self._log(f"  {target}")
+        self.scan_scope += self._matrix_scope()
+
         # Run appropriate QA checks
         if has_modern_tools:
-            # Run pkgcheck
-            pkgcheck_success, errors, warnings = self.run_pkgcheck_scan()
+            # Run pkgcheck and the manifest check side by side
+            with phase("run_qa_tools"):
+                tools_success, errors, warnings = asyncio.run(
+                    self.run_qa_tools(targets)
+                )
             total_errors += errors
             total_warnings += warnings
-            overall_success = overall_success and pkgcheck_success
-
-            # Run manifest check
-            manifest_success = self.run_pkgdev_manifest()
-            overall_success = overall_success and manifest_success
+            overall_success = overall_success and tools_success
+            if self.aborted:
+                self._error(
+                    "QA check aborted, manifest check cancelled, reports skipped"
+                )
+                return False
         else:
             # Run basic checks
-            basic_success, errors, warnings = self.run_basic_checks()
+            with phase("run_basic_checks"):
+                basic_success, errors, warnings = self.run_basic_checks()
             total_errors += errors
             total_warnings += warnings
             overall_success = overall_success and basic_success
 
-        # Directly generate reports
+        # Parse results once and share them with every report
+        with phase("get_qa_results"):
+            results = self.get_qa_results()
+        if self.distdir is not None:
+            # Watch rescans rebuild the results, so every Manifest is checked
+            with phase("verify_distfiles"):
+                self.verify_distfiles(
+                    results, targets if self.watch_results is None else None
+                )
+        with phase("record_run"):
+            run_id = self.record_run(results)
         self._log("Generating reports...")
-        self.generate_markdown_report()
-        self.generate_html_report()
-        self.generate_reports_readme()
+        with phase("generate_markdown_report"):
+            self.generate_markdown_report(results)
+        with phase("generate_html_report"):
+            self.generate_html_report(results)
+        with phase("generate_reports_readme"):
+            self.generate_reports_readme()
         self._success("Reports generated successfully")
         # Print summary to stdout
-        (
-            total_issues,
-            errors,
-            warnings,
-            info,
-            style,
-            qa_tool,
-            ignored_errors,
-            ignored_warnings,
-            ignored_info,
-            ignored_style,
-            ignored_total,
-            tolerated_errors,
-            tolerated_warnings,
-            tolerated_info,
-            tolerated_style,
-            tolerated_total,
-        ) = self.get_qa_results()
         print()
         print("📊 QA Report Summary:")
-        print(f"   Tool: {qa_tool}")
-        print(
-            f"   Total Issues: {total_issues} [{ignored_total} ignored, {tolerated_total} tolerated]"
-        )
-        print(
-            f"   Errors: {errors} [{ignored_errors} ignored, {tolerated_errors} tolerated]"
+        print(f"   Tool: {results.qa_tool}")
+        print(f"   Total Issues: {results.total_summary()}")
+        print(f"   Errors: {results.level_summary('error')}")
+        print(f"   Warnings: {results.level_summary('warning')}")
+        if results.show_minor_levels:
+            print(f"   Info: {results.level_summary('info')}")
+            print(f"   Style: {results.level_summary('style')}")
+        print(f"   Reports: {self.reports_dir}")
+        print()
+        if self.baseline:
+            # Only fail on errors/warnings that the baseline did not have
+            with phase("report_baseline"):
+                return self.report_baseline(run_id, targets)
+        # Only fail if errors/warnings not ignored/tolerated
+        return results.errors == 0 and results.warnings == 0
+
+    def watch(self) -> None:
+        """Run a full QA check, then rescan changed packages until interrupted."""
+        self.watch_results = {}
+        # Created first so edits made during the initial run are not missed
+        watcher = OverlayWatcher(
+            self.overlay_root.resolve(), [Path.cwd()], [self.reports_dir]
         )
-        print(
-            f"   Warnings: {warnings} [{ignored_warnings} ignored, {tolerated_warnings} tolerated]"
+        self.run_full_qa_check()
+        self._log(f"Watching {self.overlay_root} ({watcher.backend}), Ctrl+C to stop")
+        while True:
+            changed = watcher.wait(WATCH_DEBOUNCE)
+            start = time.monotonic()
+            # A fail-fast abort left the results in memory incomplete
+            full_rescan = self.aborted
+            self._reset_for_rescan(changed)
+            remembered = len(self.watch_results or {})
+            targets = self._watch_targets(changed)
+            if full_rescan:
+                targets = None
+            elif (
+                targets == []
+                and self._rules is not None
+                and len(self.watch_results or {}) == remembered
+            ):
+                # No scanned file, rule file or package directory changed
+                continue
+            success = self.run_full_qa_check(targets)
+            self._log(
+                f"Rescan {'passed' if success else 'failed'} in "
+                f"{time.monotonic() - start:.2f}s, watching for changes"
+            )
+
+    def _watch_targets(self, changed: Optional[Set[str]]) -> Optional[List[str]]:
+        """Map watched paths to rescan targets; None means a full rescan."""
+        if changed is None:
+            self._log("Change events lost - rescanning the whole overlay")
+            return None
+        root = self.overlay_root.resolve()
+        rel_paths: List[str] = []
+        for path in sorted(changed):
+            if Path(path).name in QA_RULE_FILES:
+                # Remembered results are refiltered when replayed
+                self._log(f"{Path(path).name} changed - reapplying rules")
+                continue
+            try:
+                rel_paths.append(str(Path(path).relative_to(root)))
+            except ValueError:
+                continue
+        for rel_path in rel_paths:
+            self._log(f"Changed: {rel_path}")
+        # Deleted packages take their results with them
+        for key in list(self.watch_results or {}):
+            if "/" in key and not (self.overlay_root / key).is_dir():
+                del self.watch_results[key]
+        targets = self._targets_for_paths(rel_paths)
+        if targets:
+            listed = ", ".join(targets[:10]) + (", ..." if len(targets) > 10 else "")
+            self._log(f"Rescanning {len(targets)} packages: {listed}")
+        return targets
+
+    def _reset_for_rescan(self, changed: Optional[Set[str]]) -> None:
+        """Drop state derived from files that may have changed."""
+        names = {Path(path).name for path in changed or ()}
+        if changed is None or names & set(QA_RULE_FILES):
+            self._rules = None
+        if changed is None:
+            self._inventory = None
+        elif self._inventory is not None:
+            root = self.overlay_root.resolve()
+            known = {
+                os.path.relpath(path, self.overlay_root)
+                for path in self._inventory.ebuilds
+                + self._inventory.eclasses
+                + self._inventory.manifests
+            }
+            for path in changed:
+                listed = path.endswith((".ebuild", ".eclass")) or (
+                    Path(path).name == "Manifest"
+                )
+                if not os.path.isfile(path) or (
+                    listed and os.path.relpath(path, root) not in known
+                ):
+                    self._inventory = None
+                    break
+        if changed is None or any(name.endswith(".eclass") for name in names):
+            self._eclass_inherits = None
+        self._cache_salt = None
+        self._qa_results = None
+        self.aborted = False
+        self.timings = PhaseTimer()
+
+    def _matrix_scope(self) -> str:
+        """Return the scan_scope suffix naming the matrix entries, if any."""
+        return f", matrix {', '.join(self.matrix)}" if self.matrix else ""
+
+    def _tree_dirty(self) -> bool:
+        """Whether the overlay has uncommitted changes outside the QA outputs."""
+        args = ["status", "--porcelain", "--", "."]
+        overlay = self.overlay_root.resolve()
+        for path in (self.reports_dir, self.history.path.parent):
+            try:
+                relative = path.resolve().relative_to(overlay)
+            except ValueError:
+                continue
+            if relative.parts:
+                args.append(f":(exclude){relative}")
+        return bool(self._git_lines(args))
+
+    def record_run(self, results: QAResults) -> Optional[int]:
+        """Store this run's issues in the history database under HEAD."""
+        if self.watch_results is not None:
+            # Rescans of uncommitted edits would flood the history
+            return None
+        commit_sha = self._get_commit_sha()
+        if not commit_sha:
+            self._log("Not a git checkout, run not stored in QA history")
+            return None
+        # Kept for the baseline diff of this run, but never used as a baseline
+        dirty = self._tree_dirty()
+        try:
+            run_id = self.history.record_run(
+                commit_sha, self.scan_scope, dirty, results
+            )
+        except (sqlite3.Error, OSError) as e:
+            self._error(f"Could not store run in {self.history.path}: {e}")
+            return None
+        note = " (uncommitted changes, not a baseline)" if dirty else ""
+        self._log(f"Run {run_id} stored in {self.history.path}{note}")
+        return run_id
+
+    def report_baseline(
+        self, run_id: Optional[int], targets: Optional[List[str]]
+    ) -> bool:
+        """Write baseline.md; True when no new error or warning needs attention."""
+        resolved = self._git_lines(
+            ["rev-parse", "--verify", f"{self.baseline}^{{commit}}"]
         )
-        if (
-            style > 0
-            or ignored_info > 0
-            or ignored_style > 0
-            or tolerated_info > 0
-            or tolerated_style > 0
-        ):
-            print(
-                f"   Info: {info} [{ignored_info} ignored, {tolerated_info} tolerated]"
+        baseline_sha = resolved[0] if resolved else str(self.baseline)
+        try:
+            baseline_run = (
+                self.history.find_run(
+                    baseline_sha, "full overlay" + self._matrix_scope(), run_id
+                )
+                if run_id is not None
+                else None
+            )
+            if baseline_run is None:
+                self._error(
+                    f"No stored clean full-overlay QA run for baseline {self.baseline}"
+                )
+                return False
+            new_rows, fixed_rows = self.history.diff(baseline_run, run_id)
+        except (sqlite3.Error, OSError) as e:
+            self._error(f"Could not read {self.history.path}: {e}")
+            return False
+        new = [QAIssue(*row[:6], bool(row[6])) for row in new_rows]
+        fixed = [QAIssue(*row[:6], bool(row[6])) for row in fixed_rows]
+        if targets is not None:
+            scanned = set(targets)
+            fixed = [issue for issue in fixed if issue.atom in scanned]
+
+        def line(issue: QAIssue) -> str:
+            version = f"-{issue.version}" if issue.version else ""
+            tolerated = " (tolerated)" if issue.tolerated else ""
+            return (
+                f"- `{issue.atom}{version}`: {issue.level.upper()}: "
+                f"{issue.check}: {issue.message}{tolerated}\n"
             )
-            print(
-                f"   Style: {style} [{ignored_style} ignored, {tolerated_style} tolerated]"
+
+        output_path = self.reports_dir / "baseline.md"
+        with open(output_path, "w", buffering=REPORT_BUFFER) as out:
+            out.write(
+                f"# 🔍 QA Baseline Comparison\n\n"
+                f"**Baseline:** `{baseline_sha[:8]}`  \n"
+                f"**Commit:** `{(self._get_commit_sha() or 'unknown')[:8]}`  \n"
+                f"**Scope:** {self.scan_scope}\n\n"
+                f"## 🆕 New Issues ({len(new)})\n\n"
             )
-        print(f"   Reports: {self.reports_dir}")
+            out.writelines(line(issue) for issue in new)
+            out.write(f"\n## ✅ Fixed Issues ({len(fixed)})\n\n")
+            out.writelines(line(issue) for issue in fixed)
+        print(f"🔍 Compared with baseline {baseline_sha[:8]}:")
+        print(f"   New Issues: {len(new)}")
+        for issue in new:
+            print(f"     {line(issue)[2:].rstrip()}")
+        print(f"   Fixed Issues: {len(fixed)}")
+        print(f"   Report: {output_path}")
         print()
-        # Only fail if errors/warnings not ignored/tolerated
-        return errors == 0 and warnings == 0
+        return not any(
+            issue.level in ("error", "warning") and not issue.tolerated for issue in new
+        )
 
     def run_basic_checks(self) -> Tuple[bool, int, int]:
         """Run basic QA checks (find, grep, awk, sed) and return results."""
@@ -954,7 +2668,7 @@ This directory contains automatically generated QA reports for the COSMIC overla
         errors = warnings = 0
         # Example basic check: find ebuilds with missing SRC_URI
         try:
-            for ebuild in self.overlay_root.glob("**/*.ebuild"):
+            for ebuild in self.get_inventory().ebuilds:
                 with open(ebuild) as f:
                     content = f.read()
                 if "SRC_URI=" not in content:
@@ -988,8 +2702,103 @@ def main() -> None:
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Suppress non-error output"
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first error not covered by .qaignore/.qatolerate",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Scan packages as parallel pkgcheck shards (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse per-package results of unchanged packages from qa-reports/.cache",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=64,
+        metavar="MB",
+        help="Maximum result cache size on disk (default: 64)",
+    )
+    parser.add_argument(
+        "--pkgcheck-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Abort pkgcheck scan after this many seconds (an in-process "
+        "--backend api scan is abandoned rather than killed)",
+    )
+    parser.add_argument(
+        "--pkgdev-timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Abort pkgdev manifest after this many seconds",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only scan packages changed since the given git ref",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="SHA",
+        help="Report only issues new or fixed since the stored run of this commit",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["process", "api"],
+        default="process",
+        help="Run pkgcheck as processes or in-process via its Python API",
+    )
+    parser.add_argument(
+        "--tools-dir",
+        metavar="DIR",
+        help="Use pkgcheck/pkgdev from DIR before PATH (see qa-fake-tools.py)",
+    )
+    parser.add_argument(
+        "--history-db",
+        metavar="PATH",
+        help="QA run history database (default: .cache/qa-history.sqlite3)",
+    )
+
+    parser.add_argument(
+        "--distdir",
+        metavar="DIR",
+        help="Verify Manifest DIST sizes and digests against the distfiles in DIR",
+    )
+    parser.add_argument(
+        "--regen",
+        action="store_true",
+        help="Regenerate Manifests and stale metadata cache entries, then exit",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and rescan packages as their files change",
+    )
+    parser.add_argument(
+        "--matrix",
+        nargs="?",
+        const="",
+        metavar="ARCH[:PROFILE],...",
+        help="Scan each arch, or arch and pkgcheck --profiles value, as a "
+        "concurrent job and merge the results (default: arches of pkgcheck.conf)",
+    )
 
     args = parser.parse_args()
+    if args.watch and (args.baseline or args.since):
+        parser.error("--watch cannot be combined with --baseline or --since")
+    if args.regen and args.watch:
+        parser.error("--regen cannot be combined with --watch")
+    if args.matrix is not None and (args.watch or args.cache or args.backend == "api"):
+        parser.error(
+            "--matrix cannot be combined with --watch, --cache or --backend api"
+        )
 
     reports_dir: str = str(args.reports_dir)
     ensure_reports_dir(reports_dir)
@@ -1003,9 +2812,14 @@ def main() -> None:
 
     try:
         checker: SimpleQAChecker = SimpleQAChecker(
-            str(args.overlay_root), reports_dir, args.config
+            str(args.overlay_root), reports_dir, args.config, QAOptions.from_args(args)
         )
-        success: bool = checker.run_full_qa_check()
+        if args.watch:
+            checker.watch()
+        if args.regen:
+            success: bool = checker.regenerate()
+        else:
+            success = checker.run_full_qa_check()
 
         # Restore stdout and print final result
         if args.quiet:
@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 
 """
-Test QA Pipeline Locally using Docker
+Test QA Pipeline Locally using Docker, Podman or the host's own tools
 
 This script mirrors the GitHub Actions workflow for local testing,
-providing a containerized environment for QA checks.
+providing a containerized environment for QA checks, or running the same
+QA script natively when pkgcheck and pkgdev are installed.
 """
 
 import argparse
+import hashlib
+import json
 import os
 import shutil
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 
 class Colors:
@@ -26,18 +30,40 @@ class Colors:
     NC = "\033[0m"  # No Color
 
 
+# Container CLIs in order of preference; both accept the same commands
+CONTAINER_RUNTIMES = ("docker", "podman")
+
+
 class DockerQATester:
-    """Docker-based QA pipeline tester."""
+    """QA pipeline tester running in Docker, Podman or natively on the host."""
 
-    def __init__(self, overlay_root: str, reports_dir: str):
+    def __init__(self, overlay_root: str, reports_dir: str, runtime: str = "auto"):
         self.overlay_root = Path(overlay_root).resolve()
         self.reports_dir = Path(reports_dir).resolve()
 
-        # Docker configuration
-        self.docker_image = "gentoo/stage3"
+        # Container CLI ("docker", "podman") or "native"; None if none works
+        self.requested_runtime = runtime
+        self.runtime = self.select_runtime(runtime)
+
+        # Docker configuration (fully qualified, Podman has no default registry)
+        self.docker_image = "docker.io/gentoo/stage3"
+        # Derived image with the QA tools installed, tagged by setup script hash
+        self.qa_image_repo = "cosmic-overlay-qa"
         self.container_name = (
             f"cosmic-overlay-qa-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
         )
+        # Named volumes kept across runs and image rebuilds: path -> volume
+        self.cache_volumes: Dict[str, str] = {
+            "/var/db/repos/gentoo": "cosmic-overlay-qa-repo",
+            "/var/cache/distfiles": "cosmic-overlay-qa-distfiles",
+            "/var/cache/binpkgs": "cosmic-overlay-qa-binpkgs",
+            "/root/.cache/pkgcheck": "cosmic-overlay-qa-pkgcheck",
+            # QA run history for --baseline, the overlay is mounted read-only
+            "/var/cache/cosmic-overlay-qa": "cosmic-overlay-qa-history",
+        }
+        # Long-lived container of the start/stop/status commands, one per overlay
+        overlay_hash = hashlib.sha256(str(self.overlay_root).encode()).hexdigest()
+        self.warm_container = f"cosmic-overlay-qa-warm-{overlay_hash[:8]}"
 
         # Create reports directory
         self.reports_dir.mkdir(parents=True, exist_ok=True)
@@ -62,22 +88,45 @@ class DockerQATester:
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"{Colors.RED}[{timestamp}]{Colors.NC} ❌ {message}")
 
-    def check_docker(self) -> bool:
-        """Check if Docker is available and running."""
-        if not shutil.which("docker"):
-            self._error("Docker is not installed or not in PATH")
-            print("Please install Docker to use this script")
-            print("Alternatively, use: ./scripts/simple-qa-check.py")
-            return False
-
-        try:
-            subprocess.run(["docker", "info"], capture_output=True, check=True)
-            self._success("Docker is available")
+    def select_runtime(self, requested: str) -> Optional[str]:
+        """Return the first working runtime out of requested ("auto" tries all).
+
+        "auto" prefers a running Docker daemon, then Podman, then the host
+        when pkgcheck and pkgdev are installed there.
+        """
+        candidates = [requested]
+        if requested == "auto":
+            candidates = list(CONTAINER_RUNTIMES) + ["native"]
+        for runtime in candidates:
+            if runtime == "native":
+                if shutil.which("pkgcheck") and shutil.which("pkgdev"):
+                    return runtime
+            elif shutil.which(runtime):
+                result = subprocess.run([runtime, "info"], capture_output=True)
+                if result.returncode == 0:
+                    return runtime
+        return None
+
+    def check_runtime(self) -> bool:
+        """Check that a runtime was found, explaining why not otherwise."""
+        if self.runtime is not None:
+            self._success(f"Using {self.runtime} runtime")
             return True
-        except subprocess.CalledProcessError:
-            self._error("Docker daemon is not running")
-            print("Please start Docker daemon")
-            return False
+
+        requested = self.requested_runtime
+        if requested == "native":
+            self._error("pkgcheck and pkgdev are not installed on this host")
+        elif requested in CONTAINER_RUNTIMES:
+            if not shutil.which(requested):
+                self._error(f"{requested} is not installed or not in PATH")
+            else:
+                self._error(f"{requested} is not working ('{requested} info' failed)")
+                print(f"Please start the {requested} daemon or service")
+        else:
+            self._error("Neither Docker, Podman nor pkgcheck/pkgdev are available")
+            print("Please install Docker or Podman to use this script")
+        print("Alternatively, use: ./scripts/simple-qa-check.py")
+        return False
 
     def prepare_docker_setup(self) -> str:
         """Prepare Docker setup script."""
@@ -86,13 +135,17 @@ set -euo pipefail
 
 echo "=== Setting up Gentoo environment for QA testing ==="
 
-# Update package database
-echo "Updating package database..."
-emerge-webrsync --quiet
+# The repository snapshot lives in the cosmic-overlay-qa-repo volume, only
+# fetch it while the volume is still empty
+if [ ! -e /var/db/repos/gentoo/metadata/timestamp.chk ]; then
+    echo "Updating package database..."
+    emerge-webrsync --quiet
+fi
 
-# Install required packages
+# Install required packages, preferring binary packages: the PKGDIR volume
+# first, then the Gentoo binhost; anything built from source is kept there
 echo "Installing QA tools..."
-emerge -q pkgcheck pkgdev
+emerge -q --usepkg --getbinpkg --buildpkg pkgcheck pkgdev
 
 # Verify installations
 echo "Verifying tool installations..."
@@ -110,53 +163,66 @@ echo "=== Environment setup complete ==="
         setup_file.chmod(0o755)
         return str(setup_file)
 
-    def prepare_qa_script(self) -> str:
-        """Prepare QA testing script for Docker."""
+    def prepare_qa_script(
+        self, sync: bool = False, native: bool = False, matrix: Optional[str] = None
+    ) -> str:
+        """Prepare QA testing script for Docker.
+
+        sync refreshes the repository snapshot in its cache volume first.
+        native writes the script for the host's paths and repository
+        instead, which it never syncs. matrix ("ARCH[:PROFILE],...", empty
+        for the arches of pkgcheck.conf) is passed on as --matrix.
+        """
+        overlay_dir, reports_dir = "/overlay", "/overlay/qa-reports"
+        sync_step = ""
+        if native:
+            overlay_dir, reports_dir = str(self.overlay_root), str(self.reports_dir)
+        else:
+            sync_check = (
+                "true"
+                if sync
+                else "[ ! -e /var/db/repos/gentoo/metadata/timestamp.chk ]"
+            )
+            sync_step = f"""
+# The repository snapshot is kept in the cosmic-overlay-qa-repo volume
+if {sync_check}; then
+    echo "Updating package database..."
+    emerge-webrsync --quiet
+fi
+"""
+        history_arg = (
+            ""
+            if native
+            else " --history-db /var/cache/cosmic-overlay-qa/qa-history.sqlite3"
+        )
+        matrix_arg = ""
+        if matrix is not None:
+            matrix_arg = f' --matrix "{matrix}"' if matrix else " --matrix"
         qa_script = f"""#!/bin/bash
 set -euo pipefail
 
-OVERLAY_ROOT="/overlay"
-REPORTS_DIR="/overlay/qa-reports"
+OVERLAY_ROOT="{overlay_dir}"
+REPORTS_DIR="{reports_dir}"
 
 echo "=== Starting COSMIC Overlay QA Pipeline Test ==="
 echo "Overlay root: $OVERLAY_ROOT"
 echo "Reports dir: $REPORTS_DIR"
-
+{sync_step}
 cd "$OVERLAY_ROOT"
 
 # Create reports directory
 mkdir -p "$REPORTS_DIR"
 
-# Run pkgcheck scan
-echo "Running pkgcheck scan..."
-if pkgcheck scan --config scripts/pkgcheck.conf --reporter JsonReporter "$OVERLAY_ROOT" > "$REPORTS_DIR/pkgcheck-scan.json" 2>&1; then
-    echo "✅ pkgcheck JSON scan completed"
+# Run pkgcheck and pkgdev and generate the reports; simple-qa-check.py
+# writes them to ./qa-reports
+echo "Running simple-qa-check.py..."
+if python3 scripts/simple-qa-check.py --overlay-root "$OVERLAY_ROOT"{history_arg}{matrix_arg}; then
+    echo "✅ QA checks passed"
 else
-    echo "⚠️  pkgcheck JSON scan completed with issues"
+    echo "⚠️  QA checks found issues"
 fi
-
-# Run pkgcheck with text output for readability
-echo "Running pkgcheck text scan..."
-if pkgcheck scan --config scripts/pkgcheck.conf --reporter StrReporter "$OVERLAY_ROOT" > "$REPORTS_DIR/pkgcheck-scan.txt" 2>&1; then
-    echo "✅ pkgcheck text scan completed"
-else
-    echo "⚠️  pkgcheck text scan completed with issues"
-fi
-
-# Run manifest check
-echo "Running manifest integrity check..."
-if pkgdev manifest "$OVERLAY_ROOT" > "$REPORTS_DIR/manifest-check.txt" 2>&1; then
-    echo "✅ Manifest check passed"
-else
-    echo "⚠️  Manifest check found issues"
-fi
-
-# Generate reports using Python script
-echo "Generating reports..."
-if python3 scripts/generate-qa-report.py --overlay-root "$OVERLAY_ROOT" --reports-dir "$REPORTS_DIR"; then
-    echo "✅ Reports generated successfully"
-else
-    echo "⚠️  Report generation had issues"
+if [ "$OVERLAY_ROOT/qa-reports" != "$REPORTS_DIR" ]; then
+    cp -r "$OVERLAY_ROOT/qa-reports/." "$REPORTS_DIR/"
 fi
 
 # Summary
@@ -164,19 +230,30 @@ echo ""
 echo "=== QA Pipeline Test Summary ==="
 echo "Results saved to: $REPORTS_DIR"
 
-# Count issues
+# Count issues; pkgcheck-scan.json holds one JsonReporter result per line
 if [ -f "$REPORTS_DIR/pkgcheck-scan.json" ]; then
-    ERRORS=$(python3 -c "
+    python3 - "$REPORTS_DIR/pkgcheck-scan.json" <<'PYEOF' || echo "Could not parse JSON results"
 import json, sys
-try:
-    with open('$REPORTS_DIR/pkgcheck-scan.json') as f:
-        data = json.load(f)
-    errors = sum(1 for item in data if item.get('level') == 'error')
-    warnings = sum(1 for item in data if item.get('level') == 'warning')
-    print(f'Errors: {{errors}}, Warnings: {{warnings}}')
-except:
-    print('Could not parse results')
-" 2>/dev/null || echo "Could not parse JSON results")
+
+counts = {{}}
+
+
+def walk(node):
+    for key, value in node.items():
+        if not isinstance(value, dict):
+            continue
+        if key.startswith("_"):
+            counts[key[1:]] = counts.get(key[1:], 0) + len(value)
+        else:
+            walk(value)
+
+
+with open(sys.argv[1]) as f:
+    for line in f:
+        if line.strip():
+            walk(json.loads(line))
+print(f"Errors: {{counts.get('error', 0)}}, Warnings: {{counts.get('warning', 0)}}")
+PYEOF
 else
     echo "No JSON results available"
 fi
@@ -192,49 +269,230 @@ echo "=== Pipeline test complete ==="
         qa_file.chmod(0o755)
         return str(qa_file)
 
-    def run_docker_container(
-        self, setup_script: str, qa_script: str, interactive: bool = False
-    ) -> bool:
-        """Run the Docker container with QA testing."""
-        self._log(f"Starting Docker container: {self.container_name}")
-
-        # Prepare Docker run command
-        docker_cmd = [
-            "docker",
-            "run",
-            "--name",
-            self.container_name,
-            "--rm",  # Remove container when done
+    def qa_image_tag(self, setup_script: str) -> str:
+        """Tag of the QA image built from docker_image by setup_script."""
+        digest = hashlib.sha256(self.docker_image.encode() + b"\0")
+        digest.update(Path(setup_script).read_bytes())
+        return f"{self.qa_image_repo}:{digest.hexdigest()[:16]}"
+
+    def _image_exists(self, image: str) -> bool:
+        result = subprocess.run(
+            [self.runtime, "image", "inspect", image], capture_output=True
+        )
+        return result.returncode == 0
+
+    def ensure_qa_image(
+        self, setup_script: str, rebuild: bool = False
+    ) -> Optional[str]:
+        """Return the QA image for setup_script, building it when missing.
+
+        The base image is only pulled when it is not present locally (or on
+        rebuild), so later runs start straight from the provisioned image.
+        """
+        tag = self.qa_image_tag(setup_script)
+        if not rebuild and self._image_exists(tag):
+            self._success(f"Reusing QA image {tag}")
+            return tag
+
+        if rebuild or not self._image_exists(self.docker_image):
+            self._log("Pulling base image...")
+            subprocess.run([self.runtime, "pull", self.docker_image], check=True)
+
+        self._log(f"Building QA image {tag} (one-time environment setup)...")
+        # Provisioned with docker run + commit rather than docker build, so
+        # the setup shares the cache volumes (binpkgs, distfiles, repo) with
+        # the QA runs; volume contents are not committed into the image
+        builder = f"{self.qa_image_repo}-build-{tag.rsplit(':', 1)[1]}"
+        subprocess.run([self.runtime, "rm", "--force", builder], capture_output=True)
+        try:
+            result = subprocess.run(
+                [self.runtime, "run", "--name", builder]
+                + self._cache_volume_args()
+                + [
+                    "-v",
+                    f"{Path(setup_script).resolve()}:/tmp/docker-setup.sh:ro",
+                    self.docker_image,
+                    "bash",
+                    "/tmp/docker-setup.sh",
+                ]
+            )
+            if result.returncode != 0:
+                self._error("QA image setup failed")
+                return None
+            result = subprocess.run(
+                [self.runtime, "commit", "--change", 'CMD ["/bin/bash"]', builder, tag],
+                capture_output=True,
+            )
+            if result.returncode != 0:
+                self._error(f"QA image commit failed: {result.stderr.decode()}")
+                return None
+        finally:
+            subprocess.run(
+                [self.runtime, "rm", "--force", builder], capture_output=True
+            )
+        self._success(f"QA image {tag} built")
+        return tag
+
+    def _cache_volume_args(self) -> List[str]:
+        args: List[str] = []
+        for path, volume in self.cache_volumes.items():
+            args += ["-v", f"{volume}:{path}"]
+        return args
+
+    def _mount_args(self) -> List[str]:
+        return [
             "-v",
             f"{self.overlay_root}:/overlay:ro",  # Mount overlay as read-only
             "-v",
             f"{self.reports_dir}:/overlay/qa-reports:rw",  # Mount reports dir as writable
             "-w",
             "/overlay",
-        ]
+        ] + self._cache_volume_args()
+
+    def warm_container_state(self) -> Optional[Dict[str, Any]]:
+        """Return the warm container's state, or None when it does not exist."""
+        result = subprocess.run(
+            [self.runtime, "inspect", "--format", "{{json .}}", self.warm_container],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return None
+        data = json.loads(result.stdout)
+        return {
+            "running": data["State"]["Running"],
+            "started": data["State"]["StartedAt"],
+            # Podman reports local images as localhost/<name>:<tag>
+            "image": data["Config"]["Image"].rsplit("/", 1)[-1],
+            "reports_dir": (data["Config"]["Labels"] or {}).get(
+                "cosmic-overlay-qa.reports-dir"
+            ),
+        }
+
+    def _warm_container_usable(self, state: Dict[str, Any], qa_image: str) -> bool:
+        return (
+            state["running"]
+            and state["image"] == qa_image
+            and state["reports_dir"] == str(self.reports_dir)
+        )
 
-        if interactive:
-            docker_cmd.extend(["-it"])
+    def start_warm_container(self, rebuild_image: bool = False) -> bool:
+        """Start the long-lived QA container that later runs docker exec into."""
+        setup_script = self.prepare_docker_setup()
+        qa_image = self.ensure_qa_image(setup_script, rebuild_image)
+        if qa_image is None:
+            return False
+        state = self.warm_container_state()
+        if state is not None:
+            if self._warm_container_usable(state, qa_image):
+                self._success(f"Warm container {self.warm_container} already running")
+                return True
+            # Outdated image, other reports dir or stopped: start over
+            subprocess.run(
+                [self.runtime, "rm", "--force", self.warm_container],
+                capture_output=True,
+            )
+        self._log(f"Starting warm container: {self.warm_container}")
+        result = subprocess.run(
+            [
+                self.runtime,
+                "run",
+                "--detach",
+                "--init",
+                "--name",
+                self.warm_container,
+                "--label",
+                f"cosmic-overlay-qa.reports-dir={self.reports_dir}",
+            ]
+            + self._mount_args()
+            + [qa_image, "sleep", "infinity"],
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            self._error(f"Could not start warm container: {result.stderr.decode()}")
+            return False
+        self._success(f"Warm container {self.warm_container} started")
+        return True
 
-        docker_cmd.append(self.docker_image)
+    def stop_warm_container(self) -> bool:
+        """Stop and remove the warm container."""
+        if self.warm_container_state() is None:
+            self._log(f"Warm container {self.warm_container} is not running")
+            return True
+        result = subprocess.run(
+            [self.runtime, "rm", "--force", self.warm_container], capture_output=True
+        )
+        if result.returncode != 0:
+            self._error(f"Could not stop warm container: {result.stderr.decode()}")
+            return False
+        self._success(f"Warm container {self.warm_container} stopped")
+        return True
+
+    def warm_container_status(self) -> bool:
+        """Print the warm container's state; True when it is running and current."""
+        state = self.warm_container_state()
+        if state is None:
+            self._log(f"Warm container {self.warm_container}: not created")
+            return False
+        current = self.qa_image_tag(self.prepare_docker_setup())
+        print(f"Container:   {self.warm_container}")
+        print(f"State:       {'running' if state['running'] else 'stopped'}")
+        print(f"Started:     {state['started']}")
+        print(f"Image:       {state['image']}")
+        print(f"Reports dir: {state['reports_dir']}")
+        if state["image"] != current:
+            self._warn(f"QA image is outdated, restart to use {current}")
+        return state["running"] and state["image"] == current
 
-        try:
-            # Start container and run setup
-            self._log("Pulling Docker image...")
-            subprocess.run(["docker", "pull", self.docker_image], check=True)
+    def run_docker_container(
+        self,
+        setup_script: str,
+        qa_script: str,
+        interactive: bool = False,
+        rebuild_image: bool = False,
+    ) -> bool:
+        """Run the Docker container with QA testing.
 
-            # Run setup in container
-            self._log("Setting up environment in container...")
-            setup_cmd = docker_cmd + ["bash", "-c", f"cat {setup_script} | bash"]
-            result = subprocess.run(setup_cmd, capture_output=not interactive)
+        When the warm container is running with the current QA image and
+        reports directory, the QA script is run in it with docker exec
+        instead of starting a new container.
+        """
+        # The script is reached through the reports mount
+        qa_command = ["bash", f"/overlay/qa-reports/{Path(qa_script).name}"]
 
-            if result.returncode != 0:
+        try:
+            # Environment setup is baked into the QA image
+            qa_image = self.ensure_qa_image(setup_script, rebuild_image)
+            if qa_image is None:
                 self._error("Environment setup failed")
                 return False
 
-            # Run QA tests
-            self._log("Running QA tests in container...")
-            qa_cmd = docker_cmd + ["bash", qa_script]
+            state = self.warm_container_state()
+            if state is not None and self._warm_container_usable(state, qa_image):
+                self._log(f"Running QA tests in warm container {self.warm_container}")
+                qa_cmd = [self.runtime, "exec", "-w", "/overlay"]
+                if interactive:
+                    qa_cmd.append("-it")
+                qa_cmd += [self.warm_container] + qa_command
+            else:
+                if state is not None and state["running"]:
+                    self._warn(
+                        f"Warm container {self.warm_container} uses another image "
+                        "or reports dir, run 'start' again to refresh it"
+                    )
+                # Prepare Docker run command
+                qa_cmd = [
+                    self.runtime,
+                    "run",
+                    "--name",
+                    self.container_name,
+                    "--rm",  # Remove container when done
+                ] + self._mount_args()
+                if interactive:
+                    qa_cmd.extend(["-it"])
+                qa_cmd += [qa_image] + qa_command
+                self._log(f"Starting container: {self.container_name}")
+                self._log("Running QA tests in container...")
             result = subprocess.run(qa_cmd, capture_output=not interactive)
 
             success = result.returncode == 0
@@ -246,19 +504,30 @@ echo "=== Pipeline test complete ==="
             return success
 
         except subprocess.CalledProcessError as e:
-            self._error(f"Docker command failed: {e}")
+            self._error(f"{self.runtime} command failed: {e}")
             return False
         except KeyboardInterrupt:
             self._warn("Test interrupted by user")
             # Try to clean up container
             try:
                 subprocess.run(
-                    ["docker", "stop", self.container_name], capture_output=True
+                    [self.runtime, "stop", self.container_name], capture_output=True
                 )
             except:
                 pass
             return False
 
+    def run_native(self, qa_script: str) -> bool:
+        """Run the QA script directly on the host with its own pkgcheck/pkgdev."""
+        self._log("Running QA tests natively on the host...")
+        result = subprocess.run(["bash", qa_script], cwd=self.overlay_root)
+        success = result.returncode == 0
+        if success:
+            self._success("QA pipeline test completed successfully")
+        else:
+            self._warn("QA pipeline test completed with issues")
+        return success
+
     def cleanup_docker_files(self):
         """Clean up temporary Docker files."""
         for filename in ["docker-setup.sh", "docker-qa-test.sh"]:
@@ -266,12 +535,22 @@ echo "=== Pipeline test complete ==="
             if filepath.exists():
                 filepath.unlink()
 
-    def run_full_test(self, interactive: bool = False, cleanup: bool = True) -> bool:
-        """Run the complete Docker-based QA test."""
+    def run_full_test(
+        self,
+        interactive: bool = False,
+        cleanup: bool = True,
+        rebuild_image: bool = False,
+        sync: bool = False,
+        matrix: Optional[str] = None,
+    ) -> bool:
+        """Run the complete QA test with the selected runtime.
+
+        matrix runs the per-arch/per-profile scan matrix, see prepare_qa_script.
+        """
         self._log("=== Starting Docker QA Pipeline Test ===")
 
-        # Check Docker
-        if not self.check_docker():
+        # Check the runtime picked at startup
+        if not self.check_runtime():
             return False
 
         # Check overlay structure
@@ -279,22 +558,29 @@ echo "=== Pipeline test complete ==="
             self._error("pkgcheck.conf not found in scripts directory")
             return False
 
-        if not (self.overlay_root / "scripts" / "generate-qa-report.py").exists():
-            self._error("generate-qa-report.py not found in scripts directory")
+        if not (self.overlay_root / "scripts" / "simple-qa-check.py").exists():
+            self._error("simple-qa-check.py not found in scripts directory")
             return False
 
         try:
-            # Prepare Docker scripts
-            self._log("Preparing Docker environment...")
-            setup_script = self.prepare_docker_setup()
-            qa_script = self.prepare_qa_script()
-
-            # Run tests
-            success = self.run_docker_container(setup_script, qa_script, interactive)
+            if self.runtime == "native":
+                success = self.run_native(
+                    self.prepare_qa_script(native=True, matrix=matrix)
+                )
+            else:
+                # Prepare Docker scripts
+                self._log("Preparing Docker environment...")
+                setup_script = self.prepare_docker_setup()
+                qa_script = self.prepare_qa_script(sync, matrix=matrix)
+
+                # Run tests
+                success = self.run_docker_container(
+                    setup_script, qa_script, interactive, rebuild_image
+                )
 
             # Show results
             if success:
-                self._success("Docker QA test completed successfully")
+                self._success(f"QA test ({self.runtime}) completed successfully")
                 self._log(f"Results available in: {self.reports_dir}")
 
                 # Show HTML report location
@@ -302,10 +588,12 @@ echo "=== Pipeline test complete ==="
                 if html_report.exists():
                     self._log(f"HTML report: file://{html_report}")
             else:
-                self._warn("Docker QA test completed with issues")
+                self._warn(f"QA test ({self.runtime}) completed with issues")
 
             return success
 
+        finally:
+            if cleanup:
                 try:
                     self.cleanup_docker_files()
                 except Exception as e:
@@ -315,7 +603,22 @@ echo "=== Pipeline test complete ==="
 def main():
     """Main function."""
     parser = argparse.ArgumentParser(
-        description="Test QA pipeline locally using Docker"
+        description="Test QA pipeline locally using Docker, Podman or native tools"
+    )
+    parser.add_argument(
+        "--runtime",
+        choices=["auto"] + list(CONTAINER_RUNTIMES) + ["native"],
+        default="auto",
+        help="Where to run the QA script (default: docker, else podman, "
+        "else natively when pkgcheck and pkgdev are installed)",
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["run", "start", "stop", "status"],
+        default="run",
+        help="Run the QA pipeline (default), or start, stop or show the warm "
+        "container that later runs reuse via docker exec",
     )
     parser.add_argument(
         "--overlay-root",
@@ -338,23 +641,63 @@ def main():
         action="store_true",
         help="Do not clean up temporary Docker files",
     )
+    parser.add_argument(
+        "--rebuild-image",
+        action="store_true",
+        help="Pull the base image and rebuild the QA image even if it exists",
+    )
+    parser.add_argument(
+        "--sync",
+        action="store_true",
+        help="Refresh the Gentoo repository snapshot in its cache volume first",
+    )
     parser.add_argument(
         "--fallback",
         action="store_true",
-        help="Fall back to simple QA check if Docker is not available",
+        help="Fall back to simple QA check if the pipeline test fails",
+    )
+    parser.add_argument(
+        "--matrix",
+        nargs="?",
+        const="",
+        metavar="ARCH[:PROFILE],...",
+        help="Scan each arch, or arch and pkgcheck profile, as a concurrent job "
+        "merged into one report (default: arches of pkgcheck.conf)",
     )
 
     args = parser.parse_args()
 
     try:
-        tester = DockerQATester(args.overlay_root, args.reports_dir)
+        tester = DockerQATester(args.overlay_root, args.reports_dir, args.runtime)
+        if args.command != "run":
+            if not tester.check_runtime():
+                sys.exit(1)
+            if tester.runtime == "native":
+                tester._error("The warm container needs docker or podman")
+                sys.exit(1)
+            try:
+                if args.command == "start":
+                    success = tester.start_warm_container(args.rebuild_image)
+                elif args.command == "stop":
+                    success = tester.stop_warm_container()
+                else:
+                    success = tester.warm_container_status()
+            finally:
+                if not args.no_cleanup:
+                    tester.cleanup_docker_files()
+            sys.exit(0 if success else 1)
+
         success = tester.run_full_test(
-            interactive=args.interactive, cleanup=not args.no_cleanup
+            interactive=args.interactive,
+            cleanup=not args.no_cleanup,
+            rebuild_image=args.rebuild_image,
+            sync=args.sync,
+            matrix=args.matrix,
         )
 
         if not success and args.fallback:
             print("\n" + "=" * 50)
-            print("Docker test failed, falling back to simple QA check...")
+            print("Pipeline test failed, falling back to simple QA check...")
             print("=" * 50)
 
             # Try to run simple QA check